@@ -3,20 +3,13 @@ Main application entry point for the wallpy-sensei CLI
 """
 
 import typer
-import logging
 from pathlib import Path
-from rich.console import Console
+from types import MappingProxyType
 from typing_extensions import Annotated
 
-from wallpy.config import ConfigManager
-from wallpy.schedule import ScheduleManager
-from wallpy.engine import WallpaperEngine
+from wallpy.cli import pack, config, service
+from wallpy.cli.utils import console, get_app_state
 
-from wallpy.cli import pack, config, service, logs
-from wallpy.cli.utils import get_app_state
-
-
-console = Console()
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -44,7 +37,7 @@ def alias_list(
 ):
     """Lists all available wallpaper packs"""
     
-    pack.list(ctx, search, albums)
+    pack.pack_list(ctx, search, albums)
 
 
 @app.command(
@@ -148,11 +141,11 @@ def main(
 
     # Initialize the application state
     state = get_app_state(verbose=verbose)
-    ctx.obj = state
 
-    # Set the active pack's name and uid in the context object according to the config file
-    config_manager = ctx.obj.get("config_manager")
-    ctx.obj["active"] = config_manager.get_active_pack()
+    # Set the active pack's name and uid in the context object according to the config file,
+    # the context is read-only from here on so subcommands can't mutate the shared state
+    config_manager = state.get("config_manager")
+    ctx.obj = MappingProxyType({**state, "active": config_manager.get_active_pack()})
 
 
 if __name__ == "__main__":
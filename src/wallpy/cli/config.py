@@ -2,18 +2,19 @@
 Command group of config-related commands for the wallpy-sensei CLI
 """
 
+import sys
 import typer
-import logging
-from pathlib import Path
-from rich.console import Console
-from typing_extensions import Annotated
+import difflib
+import functools
+import contextlib
+from rich.table import Table
+from rich.box import ROUNDED
+from collections import defaultdict
 
-from wallpy.config import ConfigManager
-from wallpy.schedule import ScheduleManager
-from wallpy.engine import WallpaperEngine
+from wallpy.models import Location
+from wallpy.cli.utils import console, get_ip_location
 
 
-console = Console()
 app = typer.Typer(
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -33,7 +34,8 @@ app.add_typer(location_app, name="location", rich_help_panel="📋 View & Edit")
     rich_help_panel="📋 View & Edit"
 )
 def show(
-    ctx: typer.Context
+    ctx: typer.Context,
+    validate: bool = typer.Option(True, "--validate/--no-validate", help="Check the config for issues")
 ):
     """Prints the global config in a human-readable format"""
 
@@ -42,62 +44,68 @@ def show(
     # Get all config fields
     config = config_manager.config
 
+    # Collect the output and print it once at the end
+    lines = []
+
     # Active Pack section
-    console.print("[bold cyan]Active Pack[/]\n", style="bold cyan")
+    lines.append("[bold cyan]Active Pack[/]\n")
     if "active" in config:
         active = config["active"]
         if active:
-            console.print(f"  ✨ [yellow]{active.get('name', 'Unnamed')}[/] [cyan italic]{active.get('uid', 'N/A')}[/]")
-            console.print(f"  📂 [dim]{active.get('path', 'N/A')}[/]")
+            lines.append(f"  ✨ [yellow]{active.get('name', 'Unnamed')}[/] [cyan italic]{active.get('uid', 'N/A')}[/]")
+            lines.append(f"  📂 [dim]{active.get('path', 'N/A')}[/]")
         else:
-            console.print("  ⚠️ No active pack configured")
+            lines.append("  ⚠️ No active pack configured")
     else:
-        console.print("  ⚠️ No active pack configured")
+        lines.append("  ⚠️ No active pack configured")
 
     # Custom Wallpacks section
-    console.print("\n[bold cyan]Custom Wallpacks[/]\n", style="bold cyan")
+    lines.append("\n[bold cyan]Custom Wallpacks[/]\n")
     if "custom_wallpacks" in config:
         custom_packs = config["custom_wallpacks"]
         if custom_packs:
             for name, path in custom_packs.items():
-                console.print(f"  📦 [yellow]{name}[/] [dim]({path})[/]")
+                lines.append(f"  📦 [yellow]{name}[/] [dim]({path})[/]")
         else:
-            console.print("  ⚠️ No custom wallpacks configured")
+            lines.append("  ⚠️ No custom wallpacks configured")
     else:
-        console.print("  ⚠️ No custom wallpacks configured")
+        lines.append("  ⚠️ No custom wallpacks configured")
 
     # Location section
-    console.print("\n[bold cyan]Location[/]\n", style="bold cyan")
+    lines.append("\n[bold cyan]Location[/]\n")
     if "location" in config:
         location = config["location"]
         if location:
-            console.print(f"  📍 Name: [yellow]{location.get('name', 'Unnamed Location')}[/]")
-            console.print(f"  🌍 Region: [yellow]{location.get('region', 'Unknown Region')}[/]")
-            console.print(f"  📊 Coordinates: [green]{location.get('latitude', 'N/A')}°N, {location.get('longitude', 'N/A')}°E[/]")
-            console.print(f"  🕒 Timezone: [green]{location.get('timezone', 'N/A')}[/]")
+            lines.append(f"  📍 Name: [yellow]{location.get('name', 'Unnamed Location')}[/]")
+            lines.append(f"  🌍 Region: [yellow]{location.get('region', 'Unknown Region')}[/]")
+            lines.append(f"  📊 Coordinates: [green]{location.get('latitude', 'N/A')}°N, {location.get('longitude', 'N/A')}°E[/]")
+            lines.append(f"  🕒 Timezone: [green]{location.get('timezone', 'N/A')}[/]")
         else:
-            console.print("  ⚠️ No location configured\n")
+            lines.append("  ⚠️ No location configured\n")
     else:
-        console.print("  ⚠️ No location configured\n")
+        lines.append("  ⚠️ No location configured\n")
 
-    # Validate and show any issues
-    validation = config_manager.validate_config()
-    if validation.failed or validation.warnings:
-        console.print("\n[bold yellow]Configuration Issues:[/]")
+    # Validate and show any issues (this checks every configured pack on disk, --no-validate skips it)
+    validation = config_manager.validate_config() if validate else None
+    if validation and (validation.failed or validation.warnings):
+        lines.append("\n[bold yellow]Configuration Issues:[/]")
         if validation.failed:
             for key, result in validation.errors.items():
                 if isinstance(result, list):
                     for item in result:
-                        console.print(f"  ❗ [red]{key.upper()}:[/] {item}")
+                        lines.append(f"  ❗ [red]{key.upper()}:[/] {item}")
                 else:
-                    console.print(f"  ❗ [red]{key.upper()}:[/] {result}")
+                    lines.append(f"  ❗ [red]{key.upper()}:[/] {result}")
         if validation.warnings:
             for key, result in validation.warnings.items():
                 if isinstance(result, list):
                     for item in result:
-                        console.print(f"  ⚠️ [yellow]{key.upper()}:[/] {item}")
+                        lines.append(f"  ⚠️ [yellow]{key.upper()}:[/] {item}")
                 else:
-                    console.print(f"  ⚠️ [yellow]{key.upper()}:[/] {result}")
+                    lines.append(f"  ⚠️ [yellow]{key.upper()}:[/] {result}")
+
+    # Render everything in one pass
+    console.print("\n".join(lines))
 
 
 @app.command(
@@ -156,9 +164,6 @@ def set(
     """Manually set location coordinates and timezone"""
     
     try:
-        from wallpy.models import Location
-        from rich.table import Table
-        from rich.box import ROUNDED
         
         # Create Location object
         loc = Location(
@@ -202,23 +207,20 @@ def set(
 )
 def auto(
     ctx: typer.Context,
-    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt")
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+    force: bool = typer.Option(False, "--force", "-f", help="Ignore the cached location and detect it again")
 ):
     """Auto-detect location using IP geolocation [dim](recommended)[/]"""
     
     try:
-        import requests
-        from wallpy.models import Location
         from rich.prompt import Confirm
-        from rich.table import Table
-        from rich.box import ROUNDED
         
         console.print("🔍 Auto-detecting location...")
         
-        # Get location from IP
-        response = requests.get('http://ipapi.co/json/')
-        if response.status_code == 200:
-            data = response.json()
+        # Get location from IP (cached for a day)
+        config_manager = ctx.obj.get("config_manager")
+        data = get_ip_location(config_manager.config_dir, force=force)
+        if data:
             # Create Location object
             loc = Location(
                 latitude=data.get('latitude'),
@@ -251,7 +253,6 @@ def auto(
             # Ask for confirmation unless --yes flag is used
             if yes or Confirm.ask("\n🤔 Set this as your location?"):
                 # Set the location
-                config_manager = ctx.obj.get("config_manager")
                 config_manager.set_location(loc)
 
                 console.print("\n✅ Location has been saved to your configuration")
@@ -270,6 +271,10 @@ def auto(
 )
 def search(ctx: typer.Context):
     """Search for a location interactively"""
+    # The search reads raw keypresses, which needs stdin to be a terminal
+    if not sys.stdin.isatty():
+        console.print("❌ Location search needs an interactive terminal, use [turquoise4]'wallpy config location set'[/] or [turquoise4]'auto'[/] instead")
+        raise typer.Exit(1)
     _run_location_wizard(ctx)
 
 
@@ -287,8 +292,6 @@ def info(
     location = config_manager.get_location()
 
     if location:
-        from rich.table import Table
-        from rich.box import ROUNDED
         
         # Create table for location details
         table = Table(
@@ -318,105 +321,136 @@ def callback(
 ):
     """Manage wallpy configuration"""
 
+@functools.lru_cache(maxsize=1)
+def _location_index() -> tuple:
+    """Flattens the astral geocoder database once for the location search
+    
+    Returns:
+        tuple: (rows, by_continent, by_city) where rows are (name, region, timezone) lowercased
+               plus the display name and location data, and the dicts map a continent key or
+               title-cased city key to its (name, data) matches
+    """
+    from astral.geocoder import database
+
+    rows = []
+    by_continent = defaultdict(list)
+    by_city = defaultdict(list)
+    for continent, cities in database().items():
+        for city, locations in cities.items():
+            for loc in locations:
+                data = {
+                    "region": loc.region,
+                    "timezone": loc.timezone,
+                    "latitude": loc.latitude,
+                    "longitude": loc.longitude
+                }
+                rows.append((loc.name.lower(), loc.region.lower(), loc.timezone.lower(), loc.name, data))
+                by_continent[continent.lower()].append((loc.name, data))
+                by_city[city.replace('_', ' ').title()].append((loc.name, data))
+
+    return rows, dict(by_continent), dict(by_city)
+
+
+@functools.lru_cache(maxsize=128)
+def _search_locations(query: str) -> list:
+    """Search locations by name, region, or timezone, results are cached since backspacing revisits queries"""
+    if not query:
+        return []
+        
+    query = query.lower()
+    rows, by_continent, by_city = _location_index()
+    
+    # First try to match continent/region
+    if query in by_continent:
+        # If exact match for continent, show all cities in that continent
+        return by_continent[query][:10]
+
+    # Search across all continents, in name, region and timezone
+    matches = [
+        (name, data)
+        for name_lc, region_lc, timezone_lc, name, data in rows
+        if query in name_lc or query in region_lc or query in timezone_lc
+    ]
+    
+    # If no direct matches, try fuzzy matching on city names
+    if not matches:
+        for match in difflib.get_close_matches(query, list(by_city), n=5, cutoff=0.6):
+            matches.extend(by_city[match])
+    
+    return matches[:10]  # Limit to 10 results
+
+
+@contextlib.contextmanager
+def _key_reader():
+    """Reads single keypresses from the terminal, cross-platform
+    
+    Yields:
+        tuple: (read_key, key_ready) where read_key() blocks for the next key and returns it as a str
+               (or "" for arrow/function keys, which are ignored), and key_ready() tells if a key is waiting.
+               Once stdin is closed read_key() returns Escape, so callers abort instead of waiting forever
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        def read_key() -> str:
+            char = msvcrt.getwch()
+            if char in ('\x00', '\xe0'):  # Arrow/function keys, skip the scan code that follows
+                msvcrt.getwch()
+                return ""
+            return char
+
+        yield read_key, msvcrt.kbhit
+        return
+
+    import os
+    import tty
+    import codecs
+    import select
+    import termios
+
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    def key_ready(timeout: float = 0) -> bool:
+        return bool(select.select([fd], [], [], timeout)[0])
+
+    def read_char() -> str:
+        # Read unbuffered so key_ready() sees exactly what is left, one byte at a time for multi-byte chars
+        char = ""
+        while not char:
+            byte = os.read(fd, 1)
+            if not byte:  # EOF, stdin was closed
+                return ""
+            char = decoder.decode(byte)
+        return char
+
+    def read_key() -> str:
+        char = read_char()
+        if not char:  # Treat a closed stdin like Escape
+            return '\x1b'
+        if char == '\x1b' and key_ready(0.01):  # Escape sequence (arrows etc.), not a lone Escape
+            # Sequences end in a letter or '~', e.g. "\x1b[A" or "\x1b[3~"
+            while key_ready(0.01):
+                char = read_char()
+                if not char or char.isalpha() or char == '~':
+                    break
+            return ""
+        return char
+
+    try:
+        tty.setcbreak(fd)
+        yield read_key, key_ready
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
 def _run_location_wizard(ctx: typer.Context):
     """Interactive location wizard using astral geocoder"""
     
-    from astral.geocoder import database, lookup
-    from rich.prompt import Prompt, Confirm
-    from rich.table import Table
+    from rich.prompt import Prompt
     from rich.live import Live
-    from rich.text import Text
-    from rich.panel import Panel
-    from rich.console import Console
-    from rich.box import ROUNDED
-    import difflib
-    import sys
-    import msvcrt  # For Windows key reading
-
-    console = Console()
-
-    # Get all locations from astral database
-    db = database()
-    
-    def search_locations(query: str) -> list:
-        """Search locations by name, region, or timezone"""
-        if not query:
-            return []
-            
-        query = query.lower()
-        matches = []
-        
-        # First try to match continent/region
-        if query in [k.lower() for k in db.keys()]:
-            # If exact match for continent, show all cities in that continent
-            continent = next(k for k in db.keys() if k.lower() == query)
-            for city, locations in db[continent].items():
-                for loc in locations:
-                    matches.append((loc.name, {
-                        "region": loc.region,
-                        "timezone": loc.timezone,
-                        "latitude": loc.latitude,
-                        "longitude": loc.longitude
-                    }))
-            return matches[:10]
-
-        # Search across all continents
-        for continent, cities in db.items():
-            for city, locations in cities.items():
-                for loc in locations:
-                    # Search in name
-                    if query in loc.name.lower():
-                        matches.append((loc.name, {
-                            "region": loc.region,
-                            "timezone": loc.timezone,
-                            "latitude": loc.latitude,
-                            "longitude": loc.longitude
-                        }))
-                        continue
-                    
-                    # Search in region
-                    if query in loc.region.lower():
-                        matches.append((loc.name, {
-                            "region": loc.region,
-                            "timezone": loc.timezone,
-                            "latitude": loc.latitude,
-                            "longitude": loc.longitude
-                        }))
-                        continue
-                    
-                    # Search in timezone
-                    if query in loc.timezone.lower():
-                        matches.append((loc.name, {
-                            "region": loc.region,
-                            "timezone": loc.timezone,
-                            "latitude": loc.latitude,
-                            "longitude": loc.longitude
-                        }))
-                        continue
-        
-        # If no direct matches, try fuzzy matching on city names
-        if not matches:
-            all_cities = []
-            for continent in db.values():
-                for city in continent.keys():
-                    all_cities.append(city.replace('_', ' ').title())
-            
-            fuzzy_matches = difflib.get_close_matches(query, all_cities, n=5, cutoff=0.6)
-            if fuzzy_matches:
-                for match in fuzzy_matches:
-                    # Find the continent and city for this match
-                    for continent, cities in db.items():
-                        for city, locations in cities.items():
-                            if city.replace('_', ' ').title() == match:
-                                for loc in locations:
-                                    matches.append((loc.name, {
-                                        "region": loc.region,
-                                        "timezone": loc.timezone,
-                                        "latitude": loc.latitude,
-                                        "longitude": loc.longitude
-                                    }))
-        
-        return matches[:10]  # Limit to 10 results
+    import time
 
     def generate_table(matches: list) -> Table:
         """Generate a table from location matches"""
@@ -443,7 +477,7 @@ def _run_location_wizard(ctx: typer.Context):
 
     def get_search_results(query: str) -> Table:
         """Get search results as a table"""
-        matches = search_locations(query)
+        matches = _search_locations(query)
         if not matches:
             return Table(
                 header_style="bold",
@@ -469,27 +503,39 @@ def _run_location_wizard(ctx: typer.Context):
         console.print("🔍 Search for a location by name, region, or timezone...")
         
         query = ""
+        shown_query = ""
+        last_update = time.monotonic()
         
-        with Live(get_search_display(""), refresh_per_second=4, console=console) as live:
+        with _key_reader() as (read_key, key_ready), \
+                Live(get_search_display(""), refresh_per_second=4, console=console) as live:
             while True:
-                if msvcrt.kbhit():
-                    char = msvcrt.getch()
-                    if char == b'\r':  # Enter
-                        break
-                    elif char == b'\x08':  # Backspace
-                        if query:
-                            query = query[:-1]
-                    elif char == b'\x1b':  # Escape
-                        return
-                    else:
-                        try:
-                            char = char.decode('utf-8')
-                            query += char
-                        except UnicodeDecodeError:
-                            continue
+                # A redraw is pending, give the user 100ms to keep typing before flushing it
+                if query != shown_query:
+                    while not key_ready() and time.monotonic() - last_update < 0.1:
+                        time.sleep(0.01)
+                    if not key_ready():
+                        live.update(get_search_display(query))
+                        shown_query, last_update = query, time.monotonic()
+
+                char = read_key()  # Blocks until a key is pressed
+                if char in ('\r', '\n'):  # Enter
+                    # Make sure the results on screen are the ones being selected from
+                    if query != shown_query:
+                        live.update(get_search_display(query))
+                    break
+                elif char in ('\x08', '\x7f'):  # Backspace
+                    if query:
+                        query = query[:-1]
+                elif char == '\x1b':  # Escape
+                    return
+                elif char.isprintable():
+                    query += char
                     
-                    # Update the entire display
+                # Redraw at most every 100ms while typing
+                now = time.monotonic()
+                if query != shown_query and now - last_update >= 0.1:
                     live.update(get_search_display(query))
+                    shown_query, last_update = query, now
 
         console.print()  # New line after search
 
@@ -503,12 +549,11 @@ def _run_location_wizard(ctx: typer.Context):
 
         try:
             idx = int(choice) - 1
-            matches = search_locations(query)
+            matches = _search_locations(query)
             if 0 <= idx < len(matches):
                 name, data = matches[idx]
                 
                 # Create Location object
-                from wallpy.models import Location
                 loc = Location(
                     latitude=data["latitude"],
                     longitude=data["longitude"],
@@ -2,24 +2,21 @@
 Command group of logs-related commands for the wallpy-sensei CLI
 """
 
+import os
 import typer
-import logging
 import shutil
 import time
+import zipfile
+from collections import deque
 from pathlib import Path
-from rich.console import Console
 from typing_extensions import Annotated
 from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
-from wallpy.config import ConfigManager
-from wallpy.schedule import ScheduleManager
-from wallpy.engine import WallpaperEngine
-from wallpy.cli.utils import get_app_state
+from wallpy.cli.utils import console
 
 
-console = Console()
 app = typer.Typer(
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -27,6 +24,28 @@ app = typer.Typer(
 )
 
 
+def _tail(path: Path, n: int, block_size: int = 8192) -> list:
+    """Returns the last n lines of a file, reading backwards from the end so large logs aren't loaded whole"""
+    if n <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        # Read one newline past n, the last line usually ends with one too
+        while pos > 0 and newlines <= n:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks))
+    return data.decode("utf-8", "replace").splitlines()[-n:]
+
+
 @app.command()
 def show(
     ctx: typer.Context,
@@ -35,45 +54,70 @@ def show(
 ):
     """Show recent log entries"""
     
-    state = get_app_state(False)
-    log_file = state["logs_dir"] / "wallpy.log"
+    logs_dir = ctx.obj["logs_dir"]
+    log_file = logs_dir / "wallpy.log"
     
     if not log_file.exists():
         console.print("[yellow]No log file found[/]")
         return
     
     try:
-        with open(log_file, "r") as f:
-            # Get last n lines
-            all_lines = f.readlines()
-            last_lines = all_lines[-lines:]
+        # Get last n lines
+        last_lines = _tail(log_file, lines)
+        
+        if follow:
+            console.print(f"[bold]Showing last {lines} lines and following...[/]")
+            console.print("Press Ctrl+C to stop following")
             
-            if follow:
-                console.print(f"[bold]Showing last {lines} lines and following...[/]")
-                console.print("Press Ctrl+C to stop following")
-                
-                # Show initial lines
-                for line in last_lines:
-                    console.print(line.strip())
-                
-                # Follow new lines
+            # Show initial lines, in one write and without markup parsing
+            console.out("\n".join(last_lines), highlight=False)
+            
+            # Follow new lines, only reading what was appended since the last tick
+            window = deque(last_lines, maxlen=lines)
+            partial = b""
+            f = open(log_file, "rb")
+            try:
                 with Live(auto_refresh=False) as live:
+                    pos = f.seek(0, os.SEEK_END)
+                    live.update(Panel(Text("\n".join(window))))
+                    live.refresh()
                     while True:
-                        with open(log_file, "r") as f:
-                            all_lines = f.readlines()
-                            if len(all_lines) > lines:
-                                new_lines = all_lines[-lines:]
-                                text = Text()
-                                for line in new_lines:
-                                    text.append(line)
-                                live.update(Panel(text))
-                                live.refresh()
                         time.sleep(1)
-            else:
-                console.print(f"[bold]Last {lines} lines:[/]")
-                for line in last_lines:
-                    console.print(line.strip())
-                    
+
+                        # The log was replaced (e.g. moved to a backup by 'logs clear'), switch to the new file
+                        try:
+                            current = os.stat(log_file)
+                        except FileNotFoundError:
+                            continue
+                        opened = os.fstat(f.fileno())
+                        replaced = (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
+                        # Start over from the top of the new file, or of this one if it was truncated in place
+                        if replaced or opened.st_size < pos:
+                            if replaced:
+                                f.close()
+                                f = open(log_file, "rb")
+                            pos = f.seek(0)
+                            partial = b""
+                            window.clear()
+                            live.update(Panel(Text("")))
+                            live.refresh()
+
+                        chunk = f.read()
+                        if not chunk:
+                            continue
+                        pos = f.tell()
+
+                        # Hold back an unterminated last line until the rest of it is written
+                        *complete, partial = (partial + chunk).split(b"\n")
+                        window.extend(line.decode("utf-8", "replace").rstrip("\r") for line in complete)
+                        live.update(Panel(Text("\n".join(window))))
+                        live.refresh()
+            finally:
+                f.close()
+        else:
+            console.print(f"[bold]Last {lines} lines:[/]")
+            console.out("\n".join(last_lines), highlight=False)
+                
     except Exception as e:
         console.print(f"[red]Error reading log file:[/] {str(e)}")
 
@@ -84,8 +128,8 @@ def clear(
 ):
     """Clear all log files"""
     
-    state = get_app_state(False)
-    log_file = state["logs_dir"] / "wallpy.log"
+    logs_dir = ctx.obj["logs_dir"]
+    log_file = logs_dir / "wallpy.log"
     
     if not log_file.exists():
         console.print("[yellow]No log file found[/]")
@@ -93,12 +137,16 @@ def clear(
     
     try:
         # Create backup of current log
-        backup_file = state["logs_dir"] / f"wallpy.log.{int(time.time())}.bak"
-        shutil.copy2(log_file, backup_file)
-        
-        # Clear the log file
-        with open(log_file, "w") as f:
-            f.write("")
+        backup_file = logs_dir / f"wallpy.log.{int(time.time())}.bak"
+        try:
+            # Renaming is instant regardless of the log's size, then start a fresh log
+            os.replace(log_file, backup_file)
+            log_file.touch()
+        except OSError:
+            # The log can't be moved (e.g. it's held open on Windows), copy it and truncate instead
+            shutil.copy2(log_file, backup_file)
+            with open(log_file, "w") as f:
+                f.write("")
             
         console.print("[green]Log file cleared successfully[/]")
         console.print(f"[dim]Backup created at: {backup_file}[/]")
@@ -114,16 +162,21 @@ def export(
 ):
     """Export logs to a zip file"""
     
-    state = get_app_state(False)
-    logs_dir = state["logs_dir"]
+    logs_dir = ctx.obj["logs_dir"]
     
     if not logs_dir.exists():
         console.print("[yellow]No logs directory found[/]")
         return
     
     try:
-        # Create zip file
-        shutil.make_archive(str(output.with_suffix("")), "zip", logs_dir)
+        # Create zip file, streaming each log in. Level 1 compresses text logs nearly as well
+        # as the default level for a fraction of the CPU time. The archive always gets a .zip suffix
+        output = output.with_suffix(".zip")
+        output_path = output.resolve()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for path in logs_dir.rglob("*"):
+                if path.is_file() and path.resolve() != output_path:
+                    zf.write(path, path.relative_to(logs_dir))
         console.print(f"[green]Logs exported successfully to:[/] {output}")
         
     except Exception as e:
@@ -4,29 +4,26 @@ Command group of pack-related commands for the wallpy-sensei CLI
 
 import typer
 import random
-import logging
-import hashlib
 from pathlib import Path
-from rich.console import Console
 from typing_extensions import Annotated
-from rich.table import Table
-from rich.box import ROUNDED
+from rich.console import Group
+from rich.text import Text
 from rich.prompt import Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from datetime import datetime, timedelta
+import os
+import re
 import shutil
 from collections import defaultdict
-from typing import Optional
-import sys
-import subprocess
-
-from wallpy.config import ConfigManager, generate_uid
-from wallpy.schedule import ScheduleManager
-from wallpy.engine import WallpaperEngine
-from wallpy.validate import Validator
+from typing import Optional, Sequence
+
 from wallpy.models import ScheduleType, Pack
+from wallpy.cli.utils import console
+
+
+# Pulls the file name out of a Content-Disposition header
+_FILENAME_RE = re.compile(r'filename="(.+?)"')
+
 
-console = Console()
 app = typer.Typer(
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -34,12 +31,137 @@ app = typer.Typer(
 )
 
 
+def _fmt_time(dt: datetime) -> str:
+    """Formats a resolved time as 24-hour HH:MM"""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def _fmt_images(images: list) -> str:
+    """Formats a list of images for display, long lists are cut down to the first two"""
+    if len(images) > 3:
+        return f"{images[0]}, {images[1]}, ... +{len(images)-2} more"
+    return ", ".join(map(str, images))
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """Copies a file like shutil.copy2, but through os.copy_file_range where it's available
+    
+    The kernel can then clone the data instead of copying it (reflinks on btrfs/XFS,
+    server-side copies on NFS), which matters for packs full of large images.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)  # Linux only
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break  # Some kernels and filesystems return 0 instead of failing, e.g. across mounts
+                    remaining -= copied
+            # Only a complete copy counts, anything short is redone the regular way below
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass  # EXDEV, ENOSYS, EINVAL and friends, do a regular copy instead
+    return shutil.copy2(src, dst)
+
+
+def _copytree(src: Path, dst: Path) -> Path:
+    """shutil.copytree using _copy_file for the files"""
+    return shutil.copytree(src, dst, copy_function=_copy_file)
+
+
+def _custom_wallpacks_by_path(config_manager) -> dict:
+    """Maps each resolved path in custom_wallpacks to its name, the first name wins if a path is listed twice"""
+    by_path = {}
+    for name, path in config_manager.config.get("custom_wallpacks", {}).items():
+        by_path.setdefault(Path(path).resolve(), name)
+    return by_path
+
+
+def _suggest_packs(config_manager, name: str, available: Sequence[str]) -> None:
+    """Prints the names closest to a name that wasn't found, or a few random ones if none are close"""
+    similar = config_manager.find_similar_pack(name, available)
+
+    if similar:
+        if len(similar) == 1:
+            console.print(f"🔍 Did you mean '{similar[0]}'?")
+        else:
+            console.print(f"🔍 Did you mean one of these?")
+            for suggestion in similar:
+                console.print(f"    📦 {suggestion}")
+    else:
+        # Print 3 names randomly from the available packs
+        console.print(f"🔍 Did you mean one of these?")
+        for suggestion in random.sample(available, min(3, len(available))):
+            console.print(f"    📦 {suggestion}")
+    
+    # Suggest the user to list all packs
+    console.print("\n✨ Use 'wallpy list' to view all available packs")
+
+
+def _resolve_pack(ctx: typer.Context, pack_name: str, pack_uid: Optional[str], action: str) -> Optional[Pack]:
+    """Finds the pack a command was pointed at, by UID, by name, or the active pack for "active"
+    
+    Prints why and returns None if there's no single matching pack. `action` finishes the
+    hint shown when several packs share the name, e.g. "preview the pack".
+    """
+
+    config_manager = ctx.obj.get("config_manager")
+
+    # If UID is provided, try to get pack by UID first
+    if pack_uid:
+        pack = config_manager.get_pack_by_uid(pack_uid)
+        if not pack:
+            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
+            return None
+    else:
+        # Check if pack_name was provided; if not, use the active pack
+        if pack_name == "active":
+            active_pack = ctx.obj.get("active")
+            if not active_pack:
+                console.print("[yellow]No active pack set[/]")
+                return None
+            # Get the pack by its UID to ensure we get the correct instance
+            pack = config_manager.get_pack_by_uid(active_pack.uid)
+            if not pack:
+                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
+                return None
+        else:
+            # Load packs in the config manager
+            results = config_manager.load_packs()
+            
+            # Check if the pack exists
+            if pack_name not in results:
+                console.print(f"🚫 Pack '{pack_name}' not found")
+
+                _suggest_packs(config_manager, pack_name, config_manager.get_nondefault_pack_names())
+                return None
+
+            # If there are multiple packs with the same name, ask for UID
+            if len(results[pack_name]) > 1:
+                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
+                for pack in results[pack_name]:
+                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
+                
+                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to {action}")
+                return None
+
+            # Get the pack object
+            pack = results[pack_name][0]
+
+    return pack
+
+
 # Basic pack operations
 @app.command(
+    name="list",
     epilog="✨ shorter alias available: [turquoise4]wallpy list[/]",
     rich_help_panel="📋 View & List"
 )
-def list(
+def pack_list(
     ctx: typer.Context,
     search: Annotated[Path, typer.Argument(help="Search for packs in the specified directory", show_default=False, metavar="[PATH]")] = None,
     albums: bool = typer.Option(False, "--albums", "-a", help="Show only albums")
@@ -57,24 +179,30 @@ def list(
         total_albums = len(config_manager.config['custom_wallpacks'])
         console.print(f"✨ Found [bold]{total_albums} albums[/]")
         found_albums = False
-        for album_name, album_path in config_manager.config["custom_wallpacks"].items():
-            path = Path(album_path)
-            if path.is_dir():
-                # Count packs in this album
-                album_packs = config_manager.scan_directory(path)
-                if album_packs:
-                    found_albums = True
-                    pack_count = sum(len(packs) for packs in album_packs.values())
-                    console.print(f"    📚 {album_name} [dim]({path})[/] - {pack_count} pack(s)")
+        album_paths = list(config_manager.config["custom_wallpacks"].items())
+
+        # Count packs in each album, a missing path or a plain file has none, so there's no need
+        # to stat it here first. The albums are independent, so they are counted concurrently
+        pack_counts = []
+        if album_paths:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(album_paths))) as executor:
+                pack_counts = list(executor.map(lambda album: config_manager.count_packs(album[1]), album_paths))
+
+        for (album_name, album_path), pack_count in zip(album_paths, pack_counts):
+            if pack_count:
+                found_albums = True
+                console.print(f"    📚 {album_name} [dim]({album_path})[/] - {pack_count} pack(s)")
         
         if not found_albums:
             console.print("🚫 No albums found")
         return
 
     if search:
-        # Search for packs in the specified directory
+        # Search for packs in the specified directory, resolved once here and reused by the scan
+        search = Path(search).resolve()
         console.print(f"🔍 Searching for packs in '{search}'\n")
-        results = config_manager.scan_directory(Path(search))
+        results = config_manager.scan_directory(search)
         if not results:
             console.print("🚫 No packs found")
             return
@@ -86,10 +214,13 @@ def list(
     
     # Show all packs
     if results:
-        console.print(f"✨ Found [bold]{total_packs} packs[/]")
-        for name, packs in results.items():
-            for pack in packs:
-                console.print(f"    📦 {name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
+        # Build the whole listing first and print it in one go, rather than one print per pack
+        lines = [f"✨ Found [bold]{total_packs} packs[/]"]
+        lines.extend(
+            f"    📦 {name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]"
+            for name, packs in results.items() for pack in packs
+        )
+        console.print("\n".join(lines))
     else:
         console.print("🚫 No packs found")
 
@@ -108,81 +239,26 @@ def info(
     If no pack is specified, shows info for the active pack.
     """
 
-    config_manager = ctx.obj.get("config_manager")
     schedule_manager = ctx.obj.get("schedule_manager")
 
-    # If UID is provided, try to get pack by UID first
-    if pack_uid:
-        pack = config_manager.get_pack_by_uid(pack_uid)
-        if not pack:
-            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
-            return
-    else:
-        # Check if pack_name was provided; if not, use the active pack
-        if pack_name == "active":
-            active_pack = ctx.obj.get("active")
-            if not active_pack:
-                console.print("[yellow]No active pack set[/]")
-                return
-            # Get the pack by its UID to ensure we get the correct instance
-            pack = config_manager.get_pack_by_uid(active_pack.uid)
-            if not pack:
-                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
-                return
-        else:
-            # Load packs in the config manager
-            results = config_manager.load_packs()
-            
-            # Check if the pack exists
-            if pack_name not in results:
-                console.print(f"🚫 Pack '{pack_name}' not found")
-
-                # Find similar pack names
-                available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-                similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-                if similar_packs and len(similar_packs) > 0:
-                    if len(similar_packs) == 1:
-                        console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-                    else:
-                        console.print(f"🔍 Did you mean one of these?")
-                        for pack in similar_packs:
-                            console.print(f"    📦 {pack}")
-                else:
-                    # Print 3 pack names randomly from the available packs
-                    console.print(f"🔍 Did you mean one of these?")
-                    random.shuffle(available_packs)
-                    for pack in available_packs[:3]:
-                        console.print(f"    📦 {pack}")
-                
-                # Suggest the user to list all packs
-                console.print("\n✨ Use 'wallpy list' to view all available packs")
-                return
-
-            # If there are multiple packs with the same name, ask for UID
-            if len(results[pack_name]) > 1:
-                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
-                for pack in results[pack_name]:
-                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
-                
-                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to show info")
-                return
-
-            # Get the pack object
-            pack = results[pack_name][0]
+    pack = _resolve_pack(ctx, pack_name, pack_uid, "show info")
+    if not pack:
+        return
 
+    # Collect the info and print it in one go, rather than one print per line
+    lines = []
     try:
         # Load schedule
         schedule_data = schedule_manager.load_schedule(pack.path / "schedule.toml")
 
         # Print pack metadata
         author_str = f"by {schedule_data.meta.author}" if schedule_data.meta.author else ""
-        console.print(f"📦 [bold]{schedule_data.meta.name}[/] [cyan italic]{pack.uid}[/] [dim italic]{author_str}[/]")
-        console.print(f"📁 [dim]{pack.path}[/]\n")
+        lines.append(f"📦 [bold]{schedule_data.meta.name}[/] [cyan italic]{pack.uid}[/] [dim italic]{author_str}[/]")
+        lines.append(f"📁 [dim]{pack.path}[/]\n")
 
         # Print schedule type
         schedule_type = "Timeblocks" if schedule_data.meta.type == ScheduleType.TIMEBLOCKS else "Days"
-        console.print(f"📅 Schedule Type: [bold]{schedule_type}[/]")
+        lines.append(f"📅 Schedule Type: [bold]{schedule_type}[/]")
 
         # Count total images
         total_images = 0
@@ -192,29 +268,31 @@ def info(
         else:
             for day in schedule_data.days.values():
                 total_images += len(day.images)
-        console.print(f"🖼️ Total Images: [bold]{total_images}[/]")
+        lines.append(f"🖼️ Total Images: [bold]{total_images}[/]")
 
         # Print schedule details
         if schedule_data.meta.type == ScheduleType.TIMEBLOCKS:
-            console.print(f"\n⏰ Timeblocks: [bold]{len(schedule_data.timeblocks)}[/]")
+            lines.append(f"\n⏰ Timeblocks: [bold]{len(schedule_data.timeblocks)}[/]")
             for block_name, block in schedule_data.timeblocks.items():
-                console.print(f"  • {block_name}: {len(block.images)} images")
+                lines.append(f"  • {block_name}: {len(block.images)} images")
                 if block.shuffle:
-                    console.print("    [dim]🔄 Shuffled[/]")
+                    lines.append("    [dim]🔄 Shuffled[/]")
         else:
-            console.print(f"\n📅 Days: [bold]{len(schedule_data.days)}[/]")
+            lines.append(f"\n📅 Days: [bold]{len(schedule_data.days)}[/]")
             for day, day_schedule in schedule_data.days.items():
-                console.print(f"  • {day.capitalize()}: {len(day_schedule.images)} images")
+                lines.append(f"  • {day.capitalize()}: {len(day_schedule.images)} images")
                 if day_schedule.shuffle:
-                    console.print("    [dim]🔄 Shuffled[/]")
+                    lines.append("    [dim]🔄 Shuffled[/]")
 
         # Show if this is the active pack
         active_pack = ctx.obj.get("active")
         if active_pack and active_pack.uid == pack.uid:
-            console.print("\n✨ [green]This is the active pack[/]")
+            lines.append("\n✨ [green]This is the active pack[/]")
 
     except Exception as e:
-        console.print(f"[red]Error:[/] {str(e)}")
+        lines.append(f"[red]Error:[/] {str(e)}")
+
+    console.print("\n".join(lines))
 
 
 @app.command(
@@ -235,320 +313,229 @@ def preview(
     config_manager = ctx.obj.get("config_manager")
     schedule_manager = ctx.obj.get("schedule_manager")
 
-    # If UID is provided, try to get pack by UID first
-    if pack_uid:
-        pack = config_manager.get_pack_by_uid(pack_uid)
-        if not pack:
-            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
-            return
-    else:
-        # Check if pack_name was provided; if not, use the active pack
-        if pack_name == "active":
-            active_pack = ctx.obj.get("active")
-            if not active_pack:
-                console.print("[yellow]No active pack set[/]")
-                return
-            # Get the pack by its UID to ensure we get the correct instance
-            pack = config_manager.get_pack_by_uid(active_pack.uid)
-            if not pack:
-                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
-                return
-        else:
-            # Load packs in the config manager
-            results = config_manager.load_packs()
-            
-            # Check if the pack exists
-            if pack_name not in results:
-                console.print(f"🚫 Pack '{pack_name}' not found")
-
-                # Find similar pack names
-                available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-                similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-                if similar_packs and len(similar_packs) > 0:
-                    if len(similar_packs) == 1:
-                        console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-                    else:
-                        console.print(f"🔍 Did you mean one of these?")
-                        for pack in similar_packs:
-                            console.print(f"    📦 {pack}")
-                else:
-                    # Print 3 pack names randomly from the available packs
-                    console.print(f"🔍 Did you mean one of these?")
-                    random.shuffle(available_packs)
-                    for pack in available_packs[:3]:
-                        console.print(f"    📦 {pack}")
-                
-                # Suggest the user to list all packs
-                console.print("\n✨ Use 'wallpy list' to view all available packs")
-                return
-
-            # If there are multiple packs with the same name, ask for UID
-            if len(results[pack_name]) > 1:
-                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
-                for pack in results[pack_name]:
-                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
-                
-                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to preview the pack")
-                return
-
-            # Get the pack object
-            pack = results[pack_name][0]
+    pack = _resolve_pack(ctx, pack_name, pack_uid, "preview the pack")
+    if not pack:
+        return
     
+    # Collected and printed together at the end
+    output = []
+
     try:
         # Load schedule
         schedule_data = schedule_manager.load_schedule(pack.path / "schedule.toml")
 
+        # Everything below is resolved against the same moment and location
+        now = datetime.now()
+        today = now.date()
+        location = config_manager.get_location()
+
         # Print pack metadata
         pack_author = f"[dim italic]by {schedule_data.meta.author}[/]" if schedule_data.meta.author else ""
-        console.print(f"📦 {schedule_data.meta.name} [cyan italic]{pack.uid}[/] {pack_author}")
-        console.print(f"📁 [dim]{pack.path}[/]\n")
-        
-        # Create table for schedule preview
-        table = Table(
-            header_style="bold",
-            box=ROUNDED,
-            show_header=True,
-            border_style="dim"
-        )
+        output.append(f"📦 {schedule_data.meta.name} [cyan italic]{pack.uid}[/] {pack_author}")
+        output.append(f"📁 [dim]{pack.path}[/]\n")
         
+        # Collect the schedule as (column, style) headers and rows of cells first.
+        # The formatted image lists are kept by block/day name for the shuffled lines below
+        formatted_images = {}
         if schedule_data.meta.type == ScheduleType.TIMEBLOCKS:
-            table.add_column("Timeblock", style="cyan", justify="left")
-            table.add_column("Time Range", style="dim", justify="left")
-            table.add_column("Images", style="yellow", justify="left")
-            table.add_column("Settings", style="dim", justify="left")
-            
-            # Get location for resolving solar times
-            location = config_manager.get_location()
+            columns = [("Timeblock", "cyan"), ("Time Range", "dim"), ("Images", "yellow"), ("Settings", "dim")]
+            rows = []
             
-            # Add each timeblock to the table
-            for block in schedule_data.timeblocks.values():
-                # Resolve start and end times
-                resolved_start = schedule_manager.solar_calculator.resolve_datetime(
-                    block.start, 
-                    datetime.now().date(), 
-                    location
-                )
-                resolved_end = schedule_manager.solar_calculator.resolve_datetime(
-                    block.end, 
-                    datetime.now().date(), 
-                    location
-                )
-                
+            # Resolve every block's start and end times in one batch
+            blocks = list(schedule_data.timeblocks.values())
+            resolved = schedule_manager.solar_calculator.resolve_many(
+                [spec for block in blocks for spec in (block.start, block.end)], today, location
+            )
+
+            # Add each timeblock
+            for block, resolved_start, resolved_end in zip(blocks, resolved[::2], resolved[1::2]):
                 # Format time range
-                time_range = f"{resolved_start.strftime('%H:%M %p')} - {resolved_end.strftime('%H:%M %p')}"
-                if resolved_start.strftime('%H:%M') != block.start or resolved_end.strftime('%H:%M') != block.end:
+                time_range = f"{_fmt_time(resolved_start)} - {_fmt_time(resolved_end)}"
+                if time_range != f"{block.start} - {block.end}":
                     time_range += f" [dim]({block.start} → {block.end})[/]"
                 
-                # Format images list
-                images = ", ".join(str(img) for img in block.images)
-                if len(block.images) > 3:
-                    images = f"{block.images[0]}, {block.images[1]}, ... +{len(block.images)-2} more"
+                images = formatted_images[block.name] = _fmt_images(block.images)
                 
                 # Format settings
                 settings = []
                 if block.shuffle:
                     settings.append("🔄 shuffled")
                 
-                # Add row to table
-                table.add_row(
+                rows.append((
                     block.name,
                     time_range,
                     images,
                     " | ".join(settings) if settings else "-"
-                )
+                ))
         else:  # Days-based schedule
-            table.add_column("Day", style="cyan", justify="left")
-            table.add_column("Images", style="yellow", justify="left")
-            table.add_column("Settings", style="dim", justify="left")
+            columns = [("Day", "cyan"), ("Images", "yellow"), ("Settings", "dim")]
+            rows = []
             
-            # Add each day to the table
+            # Add each day
             for day, day_schedule in schedule_data.days.items():
-                # Format images list
-                images = ", ".join(str(img) for img in day_schedule.images)
-                if len(day_schedule.images) > 3:
-                    images = f"{day_schedule.images[0]}, {day_schedule.images[1]}, ... +{len(day_schedule.images)-2} more"
+                images = formatted_images[day] = _fmt_images(day_schedule.images)
                 
                 # Format settings
                 settings = []
                 if day_schedule.shuffle:
                     settings.append("🔄 shuffled")
                 
-                # Add row to table
-                table.add_row(
+                rows.append((
                     day.capitalize(),
                     images,
                     " | ".join(settings) if settings else "-"
-                )
+                ))
         
-        # Print the table
-        console.print(table)
-
-        # Get current time
-        now = datetime.now()
+        if console.is_terminal:
+            # Create table for schedule preview, rich's table module is only loaded by the commands that draw one
+            from rich.table import Table
+            from rich.box import ROUNDED
+            table = Table(
+                header_style="bold",
+                box=ROUNDED,
+                show_header=True,
+                border_style="dim"
+            )
+            for column, style in columns:
+                table.add_column(column, style=style, justify="left")
+            for row in rows:
+                table.add_row(*row)
+            output.append(table)
+        else:
+            # Piped output gets plain tab-separated lines, easier for scripts and no table layout to compute.
+            # They're written past rich, which would expand the tabs and crop long lines to the console width
+            console.print(Group(*output))
+            output = []
+            console.file.write("".join(
+                "\t".join(Text.from_markup(cell).plain for cell in row) + "\n"
+                for row in [[column for column, _ in columns], *rows]
+            ))
         
         # Show current and next timeblock/day
         if schedule_data.meta.type == ScheduleType.TIMEBLOCKS:
             # Get current timeblock
-            current_block = schedule_manager.get_block(schedule_data, location)
+            current_block = schedule_manager.get_block(schedule_data, location, when=now)
             
             if current_block:
-                console.print(f"\n✨ [green]{current_block.name}[/] timeblock is active currently")
+                output.append(Text.assemble("\n✨ ", (str(current_block.name), "green"), " timeblock is active currently"))
+
+                # The next wallpaper is needed for both the current and the next line, look it up once
+                next_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True, get_next=True, when=now)
 
                 if current_block.shuffle:
-                    # Format images list
-                    images = ", ".join(str(img) for img in current_block.images)
-                    if len(current_block.images) > 3:
-                        images = f"{current_block.images[0]}, {current_block.images[1]}, ... +{len(current_block.images)-2} more"
+                    images = formatted_images[current_block.name]
 
-                    console.print(f"✅ current wallpaper is shuffled from [yellow]{images}[/]")
+                    output.append(Text.assemble("✅ current wallpaper is shuffled from ", (str(images), "yellow")))
                 
                 else:
                     # Get current wallpaper info
-                    current_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True)
+                    current_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True, when=now)
                     if current_result and current_result[0]:
                         current_image, current_start, current_end = current_result
                         
-                        # Get next wallpaper to calculate effective duration
-                        next_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True, get_next=True)
+                        # Use the next wallpaper to calculate effective duration
                         if next_result and next_result[0]:
                             next_image, next_start, next_end = next_result
                             # If there's a gap between current end and next start, use next start as effective end
                             if next_start > current_end:
                                 current_end = next_start
                         
-                        console.print(f"✅ [green]{current_image}[/] is the current wallpaper [dim]({current_start.strftime('%H:%M %p')} - {current_end.strftime('%H:%M %p')})[/]")
+                        output.append(Text.assemble("✅ ", (str(current_image), "green"), " is the current wallpaper ", (f"({_fmt_time(current_start)} - {_fmt_time(current_end)})", "dim")))
                     else:
-                        console.print("⚠️ [yellow]No current wallpaper[/]")
+                        output.append("⚠️ [yellow]No current wallpaper[/]")
 
-                # Get next wallpaper info
-                next_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True, get_next=True)
+                # Show next wallpaper info
                 if next_result and next_result[0]:
                     next_image, next_start, next_end = next_result
                     
-                    # Get the wallpaper after next to calculate effective duration
-                    next_next_result = schedule_manager.get_wallpaper(schedule_data, location, include_time=True, get_next=True)
-                    if next_next_result and next_next_result[0]:
-                        next_next_image, next_next_start, next_next_end = next_next_result
-                        # If there's a gap between next end and next-next start, use next-next start as effective end
-                        if next_next_start > next_end:
-                            next_end = next_next_start
-                    
                     # Check if next wallpaper will be from current or next block
-                    now = datetime.now()
                     if current_block:
                         # Calculate time remaining in current block
-                        start, end, image_duration = schedule_manager._get_block_times(current_block, now.date(), location)
+                        start, end, image_duration = schedule_manager._get_block_times(current_block, today, location)
                         time_remaining = (end - now).total_seconds()
                         
                         # If there's enough time for another image in current block
                         if time_remaining >= image_duration:
                             # Next wallpaper will be from current block
                             if current_block.shuffle:
-                                # Format images list
-                                images = ", ".join(str(img) for img in current_block.images)
-                                if len(current_block.images) > 3:
-                                    images = f"{current_block.images[0]}, {current_block.images[1]}, ... +{len(current_block.images)-2} more"
-                                console.print(f"🔀 next wallpaper will be shuffled from current timeblock [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                output.append(Text.assemble("🔀 next wallpaper will be shuffled from current timeblock ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                             else:
-                                console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                         else:
                             # Next wallpaper will be from next block
-                            next_block = schedule_manager.get_block(schedule_data, location, get_next=True)
+                            next_block = schedule_manager.get_block(schedule_data, location, get_next=True, when=now)
                             if next_block and next_block.shuffle:
-                                # Format images list
-                                images = ", ".join(str(img) for img in next_block.images)
-                                if len(next_block.images) > 3:
-                                    images = f"{next_block.images[0]}, {next_block.images[1]}, ... +{len(next_block.images)-2} more"
-                                console.print(f"🔀 next wallpaper will be shuffled from [yellow]{next_block.name}[/] [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                output.append(Text.assemble("🔀 next wallpaper will be shuffled from ", (str(next_block.name), "yellow"), " ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                             else:
-                                console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                 else:
-                    console.print("⚠️ [yellow]No next wallpaper[/]")
+                    output.append("⚠️ [yellow]No next wallpaper[/]")
             else:
-                console.print("\n⚠️ [yellow]No active timeblock[/]")
+                output.append("\n⚠️ [yellow]No active timeblock[/]")
                 
         elif schedule_data.meta.type == ScheduleType.DAYS:  
+            # Today's and tomorrow's names and schedules, shared by the current and next lines
+            current_day = now.strftime("%A").lower()
+            next_day = (now + timedelta(days=1)).strftime("%A").lower()
+            day_schedule = schedule_data.days.get(current_day)
+            next_day_schedule = schedule_data.days.get(next_day)
+
             # Get current wallpaper info
-            current_result = schedule_manager.get_wallpaper(schedule_data, include_time=True)
+            current_result = schedule_manager.get_wallpaper(schedule_data, include_time=True, when=now)
             if current_result and current_result[0]:
                 current_image, current_start, current_end = current_result
                 
-                # Get current day's schedule
-                current_day = now.strftime("%A").lower()
-                if current_day in schedule_data.days:
-                    day_schedule = schedule_data.days[current_day]
-                    
+                # Check the current day's schedule
+                if day_schedule is not None:
                     if day_schedule.shuffle:
-                        # Format images list
-                        images = ", ".join(str(img) for img in day_schedule.images)
-                        if len(day_schedule.images) > 3:
-                            images = f"{day_schedule.images[0]}, {day_schedule.images[1]}, ... +{len(day_schedule.images)-2} more"
-                        console.print(f"\n✅ current wallpaper is shuffled from [yellow]{images}[/]")
+                        images = formatted_images[current_day]
+                        output.append(Text.assemble("\n✅ current wallpaper is shuffled from ", (str(images), "yellow")))
                     else:
-                        console.print(f"\n✅ [green]{current_image}[/] is the current wallpaper [dim]({current_start.strftime('%H:%M %p')} - {current_end.strftime('%H:%M %p')})[/]")
+                        output.append(Text.assemble("\n✅ ", (str(current_image), "green"), " is the current wallpaper ", (f"({_fmt_time(current_start)} - {_fmt_time(current_end)})", "dim")))
                 else:
-                    console.print(f"\n✅ [green]{current_image}[/] is the current wallpaper [dim]({current_start.strftime('%H:%M %p')} - {current_end.strftime('%H:%M %p')})[/]")
+                    output.append(Text.assemble("\n✅ ", (str(current_image), "green"), " is the current wallpaper ", (f"({_fmt_time(current_start)} - {_fmt_time(current_end)})", "dim")))
             else:
-                console.print("\n⚠️ [yellow]No current wallpaper[/]")
+                output.append("\n⚠️ [yellow]No current wallpaper[/]")
 
             # Get next wallpaper info
-            next_result = schedule_manager.get_wallpaper(schedule_data, include_time=True, get_next=True)
+            next_result = schedule_manager.get_wallpaper(schedule_data, include_time=True, get_next=True, when=now)
             if next_result and next_result[0]:
                 next_image, next_start, next_end = next_result
                 
-                # Get current day's schedule for display purposes
-                current_day = now.strftime("%A").lower()
-                if current_day in schedule_data.days:
-                    day_schedule = schedule_data.days[current_day]
-                    
+                # Check the current day's schedule for display purposes
+                if day_schedule is not None:
                     if day_schedule.shuffle:
-                        # Format images list
-                        images = ", ".join(str(img) for img in day_schedule.images)
-                        if len(day_schedule.images) > 3:
-                            images = f"{day_schedule.images[0]}, {day_schedule.images[1]}, ... +{len(day_schedule.images)-2} more"
-                        console.print(f"🔀 next wallpaper will be shuffled from [yellow]{current_day}[/] [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                        output.append(Text.assemble("🔀 next wallpaper will be shuffled from ", (str(current_day), "yellow"), " ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                     else:
                         # For non-shuffled days, check if next image is from current day
-                        if next_image in day_schedule.images:
-                            console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                        if next_image in day_schedule.image_set:
+                            output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                         else:
                             # Next image is from next day
-                            next_day = (now + timedelta(days=1)).strftime("%A").lower()
-                            if next_day in schedule_data.days:
-                                next_day_schedule = schedule_data.days[next_day]
-                                
+                            if next_day_schedule is not None:
                                 if next_day_schedule.shuffle:
-                                    # Format images list
-                                    images = ", ".join(str(img) for img in next_day_schedule.images)
-                                    if len(next_day_schedule.images) > 3:
-                                        images = f"{next_day_schedule.images[0]}, {next_day_schedule.images[1]}, ... +{len(next_day_schedule.images)-2} more"
-                                    console.print(f"🔀 next wallpaper will be shuffled from [yellow]{next_day}[/] [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                    output.append(Text.assemble("🔀 next wallpaper will be shuffled from ", (str(next_day), "yellow"), " ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                                 else:
-                                    console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                    output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                             else:
-                                console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                                output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                 else:
                     # If current day has no schedule, next wallpaper is from next day
-                    next_day = (now + timedelta(days=1)).strftime("%A").lower()
-                    if next_day in schedule_data.days:
-                        next_day_schedule = schedule_data.days[next_day]
-                        
+                    if next_day_schedule is not None:
                         if next_day_schedule.shuffle:
-                            # Format images list
-                            images = ", ".join(str(img) for img in next_day_schedule.images)
-                            if len(next_day_schedule.images) > 3:
-                                images = f"{next_day_schedule.images[0]}, {next_day_schedule.images[1]}, ... +{len(next_day_schedule.images)-2} more"
-                            console.print(f"🔀 next wallpaper will be shuffled from [yellow]{next_day}[/] [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                            output.append(Text.assemble("🔀 next wallpaper will be shuffled from ", (str(next_day), "yellow"), " ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                         else:
-                            console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                            output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
                     else:
-                        console.print(f"⏭️ [yellow]{next_image}[/] will be the next wallpaper [dim]({next_start.strftime('%H:%M %p')} - {next_end.strftime('%H:%M %p')})[/]")
+                        output.append(Text.assemble("⏭️ ", (str(next_image), "yellow"), " will be the next wallpaper ", (f"({_fmt_time(next_start)} - {_fmt_time(next_end)})", "dim")))
             else:
-                console.print("⚠️ [yellow]No next wallpaper[/]")
+                output.append("⚠️ [yellow]No next wallpaper[/]")
         
     except Exception as e:
-        console.print(f"[red]Error:[/] {str(e)}")
+        output.append(f"[red]Error:[/] {str(e)}")
+
+    # Render everything in one pass instead of once per line
+    console.print(Group(*output))
 
 
 @app.command(
@@ -578,10 +565,7 @@ def activate(
     schedule_manager = ctx.obj.get("schedule_manager")
     engine = ctx.obj.get("engine")
 
-    # Load packs in the config manager
-    results = config_manager.load_packs()
-    
-    # If UID is provided, try to activate by UID first
+    # If UID is provided, try to activate by UID first, the UID index doesn't need a fresh scan
     if pack_uid:
         pack = config_manager.get_pack_by_uid(pack_uid)
         if pack:
@@ -593,11 +577,11 @@ def activate(
                 try:
                     # Get the current wallpaper path
                     schedule_file = pack.path / "schedule.toml"
-                    if not schedule_file.exists():
+                    try:
+                        schedule = schedule_manager.load_schedule(schedule_file)
+                    except FileNotFoundError:
                         console.print(f"⚠️ Schedule file not found at {schedule_file}")
                         return
-                        
-                    schedule = schedule_manager.load_schedule(schedule_file)
                     wallpaper_path = schedule_manager.get_wallpaper(schedule, config_manager.get_location())
                     
                     if not wallpaper_path:
@@ -627,31 +611,15 @@ def activate(
     if not pack_name:
         console.print("🚫 Please provide either a pack name or UID")
         return
+
+    # Load packs in the config manager
+    results = config_manager.load_packs()
         
     # Check if the pack exists
     if pack_name not in results:
         console.print(f"🚫 Pack '{pack_name}' not found")
 
-        # Find similar pack names
-        available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-        similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-        if similar_packs and len(similar_packs) > 0:
-            if len(similar_packs) == 1:
-                console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-            else:
-                console.print(f"🔍 Did you mean one of these?")
-                for pack in similar_packs:
-                    console.print(f"    📦 {pack}")
-        else:
-            # Print 3 pack names randomly from the available packs
-            console.print(f"🔍 Did you mean one of these?")
-            random.shuffle(available_packs)
-            for pack in available_packs[:3]:
-                console.print(f"    📦 {pack}")
-        
-        # Suggest the user to list all packs
-        console.print("\n✨ Use 'wallpy list' to view all available packs")
+        _suggest_packs(config_manager, pack_name, config_manager.get_nondefault_pack_names())
         return
     
     # If there are duplicate packs, ask the user to use the UID
@@ -675,11 +643,11 @@ def activate(
         try:
             # Get the current wallpaper path
             schedule_file = pack.path / "schedule.toml"
-            if not schedule_file.exists():
+            try:
+                schedule = schedule_manager.load_schedule(schedule_file)
+            except FileNotFoundError:
                 console.print(f"⚠️ Schedule file not found at {schedule_file}")
                 return
-                
-            schedule = schedule_manager.load_schedule(schedule_file)
             wallpaper_path = schedule_manager.get_wallpaper(schedule, config_manager.get_location())
             
             if not wallpaper_path:
@@ -716,68 +684,11 @@ def validate(
     If no pack is specified, the active pack is validated.
     """
 
-    config_manager = ctx.obj.get("config_manager")
     validator = ctx.obj.get("validator")
 
-    # If UID is provided, try to get pack by UID first
-    if pack_uid:
-        pack = config_manager.get_pack_by_uid(pack_uid)
-        if not pack:
-            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
-            return
-    else:
-        # Check if pack_name was provided; if not, use the active pack
-        if pack_name == "active":
-            active_pack = ctx.obj.get("active")
-            if not active_pack:
-                console.print("[yellow]No active pack set[/]")
-                return
-            # Get the pack by its UID to ensure we get the correct instance
-            pack = config_manager.get_pack_by_uid(active_pack.uid)
-            if not pack:
-                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
-                return
-        else:
-            # Load packs in the config manager
-            results = config_manager.load_packs()
-            
-            # Check if the pack exists
-            if pack_name not in results:
-                console.print(f"🚫 Pack '{pack_name}' not found")
-
-                # Find similar pack names
-                available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-                similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-                if similar_packs and len(similar_packs) > 0:
-                    if len(similar_packs) == 1:
-                        console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-                    else:
-                        console.print(f"🔍 Did you mean one of these?")
-                        for pack in similar_packs:
-                            console.print(f"    📦 {pack}")
-                else:
-                    # Print 3 pack names randomly from the available packs
-                    console.print(f"🔍 Did you mean one of these?")
-                    random.shuffle(available_packs)
-                    for pack in available_packs[:3]:
-                        console.print(f"    📦 {pack}")
-                
-                # Suggest the user to list all packs
-                console.print("\n✨ Use 'wallpy list' to view all available packs")
-                return
-
-            # If there are multiple packs with the same name, ask for UID
-            if len(results[pack_name]) > 1:
-                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
-                for pack in results[pack_name]:
-                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
-                
-                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to validate the pack")
-                return
-
-            # Get the pack object
-            pack = results[pack_name][0]
+    pack = _resolve_pack(ctx, pack_name, pack_uid, "validate the pack")
+    if not pack:
+        return
 
     # Validate the pack
     result = validator.validate_pack(pack)
@@ -828,67 +739,9 @@ def edit(
     If no pack is specified, the active pack's schedule is opened.
     """
 
-    config_manager = ctx.obj.get("config_manager")
-
-    # If UID is provided, try to get pack by UID first
-    if pack_uid:
-        pack = config_manager.get_pack_by_uid(pack_uid)
-        if not pack:
-            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
-            return
-    else:
-        # If pack_name is "active", get the active pack
-        if pack_name == "active":
-            active_pack = ctx.obj.get("active")
-            if not active_pack:
-                console.print("[yellow]No active pack set[/]")
-                return
-            # Get the pack by its UID to ensure we get the correct instance
-            pack = config_manager.get_pack_by_uid(active_pack.uid)
-            if not pack:
-                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
-                return
-        else:
-            # Load packs in the config manager
-            results = config_manager.load_packs()
-            
-            # Check if the pack exists
-            if pack_name not in results:
-                console.print(f"🚫 Pack '{pack_name}' not found")
-
-                # Find similar pack names
-                available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-                similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-                if similar_packs and len(similar_packs) > 0:
-                    if len(similar_packs) == 1:
-                        console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-                    else:
-                        console.print(f"🔍 Did you mean one of these?")
-                        for pack in similar_packs:
-                            console.print(f"    📦 {pack}")
-                else:
-                    # Print 3 pack names randomly from the available packs
-                    console.print(f"🔍 Did you mean one of these?")
-                    random.shuffle(available_packs)
-                    for pack in available_packs[:3]:
-                        console.print(f"    📦 {pack}")
-                
-                # Suggest the user to list all packs
-                console.print("\n✨ Use 'wallpy list' to view all available packs")
-                return
-
-            # If there are multiple packs with the same name, ask for UID
-            if len(results[pack_name]) > 1:
-                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
-                for pack in results[pack_name]:
-                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
-                
-                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to edit the pack")
-                return
-
-            # Get the pack object
-            pack = results[pack_name][0]
+    pack = _resolve_pack(ctx, pack_name, pack_uid, "edit the pack")
+    if not pack:
+        return
 
     # Get the schedule file path
     schedule_file = pack.path / "schedule.toml"
@@ -899,7 +752,6 @@ def edit(
     # Open the schedule file in the default editor
     try:
         import subprocess
-        import os
         import platform
 
         # Get the default editor based on the platform
@@ -945,7 +797,8 @@ def download(
         import requests
         import tempfile
         import zipfile
-        from urllib.parse import urlparse, unquote
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+        from wallpy.config import generate_uid
 
         # Create a temporary directory for downloading and extracting
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -962,8 +815,7 @@ def download(
             # Get filename from Content-Disposition header
             content_disposition = response.headers.get('content-disposition')
             if content_disposition:
-                import re
-                filename_match = re.search(r'filename="(.+?)"', content_disposition)
+                filename_match = _FILENAME_RE.search(content_disposition)
                 if filename_match:
                     filename = filename_match.group(1)
                 else:
@@ -971,9 +823,10 @@ def download(
             else:
                 filename = "pack.zip"
 
-            # Save the ZIP file with progress bar
-            zip_path = temp_dir_path / filename
-            with open(zip_path, "wb") as f:
+            # Save the ZIP with a progress bar, into a temporary file that is extracted from
+            # while it's still open instead of being reopened by name. It's a real file rather
+            # than a SpooledTemporaryFile, which zipfile can't read before Python 3.11
+            with tempfile.TemporaryFile(dir=temp_dir) as zip_buffer:
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -984,15 +837,17 @@ def download(
                 ) as progress:
                     task = progress.add_task(f"{filename}...", total=total_size)
                     
-                    for chunk in response.iter_content(chunk_size=8192):
+                    # Large chunks keep the per-chunk Python and progress bar overhead down
+                    for chunk in response.iter_content(chunk_size=256 * 1024):
                         if chunk:
-                            f.write(chunk)
+                            zip_buffer.write(chunk)
                             progress.update(task, advance=len(chunk))
 
-            # Extract the ZIP file
-            console.print("\n📦 Extracting pack...")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir_path)
+                # Extract the ZIP file
+                console.print("\n📦 Extracting pack...")
+                zip_buffer.seek(0)
+                with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
+                    zip_ref.extractall(temp_dir_path)
 
             # Find the pack directory (should be the only directory in temp_dir)
             pack_dirs = [d for d in temp_dir_path.iterdir() if d.is_dir()]
@@ -1040,7 +895,7 @@ def download(
 
             # Copy the pack to destination
             console.print(f"📋 Copying pack...")
-            shutil.copytree(pack_dir, dest_path)
+            _copytree(pack_dir, dest_path)
 
             console.print(f"\n✅ Successfully downloaded and installed pack to [dim]{dest_path}[/]")
 
@@ -1071,6 +926,8 @@ def pack_import(
     Use --name to specify a custom name for the album.
     """
 
+    from wallpy.config import generate_uid
+
     config_manager = ctx.obj.get("config_manager")
     validator = ctx.obj.get("validator")
 
@@ -1170,53 +1027,70 @@ def pack_import(
 
     # Process each pack
     imported_count = 0
+    pack_items = [pack for pack_list in packs.values() for pack in pack_list]
+
+    if copy:
+        # Pick every destination up front, so two packs with the same name can't claim the same one
+        copies = []
+        taken = set()
+        for pack in pack_items:
+            dest_path = config_manager.packs_dir / pack.name
+            
+            # If pack already exists, add a number suffix
+            counter = 1
+            while dest_path in taken or dest_path.exists():
+                dest_path = config_manager.packs_dir / f"{pack.name}_{counter}"
+                counter += 1
+            taken.add(dest_path)
+            copies.append((pack, dest_path))
+
+        def copy_pack(item):
+            """Copies a pack to its destination, returning the error instead of raising it"""
+            pack, dest_path = item
+            try:
+                _copytree(pack.path, dest_path)
+            except Exception as e:
+                return e
+            return None
+
+        # Copying is I/O bound, so the packs are copied concurrently
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(copies))) as executor:
+            errors = list(executor.map(copy_pack, copies))
 
-    for pack_name, pack_list in packs.items():
-        for pack in pack_list:
+        for (pack, dest_path), error in zip(copies, errors):
+            if error:
+                console.print(f"🚫 Error importing pack '{pack.name}': {str(error)}")
+            else:
+                console.print(f"✅ Copied pack '{pack.name}' to [dim]{dest_path}[/]")
+                imported_count += 1
+    else:
+        for pack in pack_items:
             try:
-                if copy:
-                    # Copy pack to wallpy packs directory
-                    dest_path = config_manager.packs_dir / pack.name
-                    
-                    # If pack already exists, add a number suffix
-                    counter = 1
-                    while dest_path.exists():
-                        dest_path = config_manager.packs_dir / f"{pack.name}_{counter}"
-                        counter += 1
-                    
-                    # Copy the pack
-                    shutil.copytree(pack.path, dest_path)
-                    
-                    # Create new pack object with new path
-                    new_pack = Pack(
-                        name=dest_path.name,
-                        path=dest_path,
-                        uid=generate_uid(str(dest_path))
-                    )
-                    
-                    console.print(f"✅ Copied pack '{pack.name}' to [dim]{dest_path}[/]")
-                    imported_count += 1
-                else:
-                    # Add pack to custom paths in config
-                    if "custom_wallpacks" not in config_manager.config:
-                        config_manager.config["custom_wallpacks"] = {}
+                # Add pack to custom paths in config
+                if "custom_wallpacks" not in config_manager.config:
+                    config_manager.config["custom_wallpacks"] = {}
 
-                    # Use relative path if possible
-                    try:
-                        rel_path = pack.path.relative_to(config_manager.config_dir)
-                        config_manager.config["custom_wallpacks"][pack.name] = str(rel_path)
-                    except ValueError:
-                        # If not possible to make relative, use absolute path
-                        config_manager.config["custom_wallpacks"][pack.name] = str(pack.path)
-                    
-                    # Save config
-                    config_manager._save_config(config_manager.config)
-                    
-                    console.print(f"✅ Added pack '{pack.name}' to config [dim]({pack.path})[/]")
-                    imported_count += 1
+                # Use relative path if possible
+                try:
+                    rel_path = pack.path.relative_to(config_manager.config_dir)
+                    config_manager.config["custom_wallpacks"][pack.name] = str(rel_path)
+                except ValueError:
+                    # If not possible to make relative, use absolute path
+                    config_manager.config["custom_wallpacks"][pack.name] = str(pack.path)
+                
+                console.print(f"✅ Added pack '{pack.name}' to config [dim]({pack.path})[/]")
+                imported_count += 1
             except Exception as e:
                 console.print(f"🚫 Error importing pack '{pack.name}': {str(e)}")
 
+    # Save the config once for all the packs added to it
+    if imported_count > 0 and not copy:
+        try:
+            config_manager._save_config(config_manager.config)
+        except Exception as e:
+            console.print(f"🚫 Error saving config: {str(e)}")
+
     if imported_count > 0:
         console.print(f"\n✨ Successfully imported {imported_count} pack(s)")
     else:
@@ -1282,14 +1156,9 @@ def remove(
         # Check if the pack is in the wallpy packs directory
         is_in_packs_dir = pack.path.is_relative_to(config_manager.packs_dir)
         
-        # Check if pack is directly in custom_wallpacks
-        is_direct_pack = False
-        if "custom_wallpacks" in config_manager.config:
-            custom_wallpacks = dict(config_manager.config["custom_wallpacks"])
-            for pack_name, path in custom_wallpacks.items():
-                if Path(path).resolve() == pack.path:
-                    is_direct_pack = True
-                    break
+        # Check if pack is directly in custom_wallpacks, and under which name
+        direct_name = _custom_wallpacks_by_path(config_manager).get(pack.path)
+        is_direct_pack = direct_name is not None
 
         # If pack is not directly in custom_wallpacks and not in packs_dir, it's part of an album
         if not is_direct_pack and not is_in_packs_dir:
@@ -1311,11 +1180,7 @@ def remove(
         try:
             # Remove from config if it's a direct pack
             if is_direct_pack:
-                custom_wallpacks = dict(config_manager.config["custom_wallpacks"])
-                for pack_name, path in custom_wallpacks.items():
-                    if Path(path).resolve() == pack.path:
-                        del config_manager.config["custom_wallpacks"][pack_name]
-                        break
+                del config_manager.config["custom_wallpacks"][direct_name]
 
             # If in packs directory, delete the pack
             if is_in_packs_dir:
@@ -1335,26 +1200,7 @@ def remove(
     if name not in packs:
         console.print(f"🚫 Pack or album '{name}' not found")
 
-        # Find similar names
-        available_names = list(packs.keys())
-        similar_names = config_manager.find_similar_pack(name, available_names)
-
-        if similar_names and len(similar_names) > 0:
-            if len(similar_names) == 1:
-                console.print(f"🔍 Did you mean '{similar_names[0]}'?")
-            else:
-                console.print(f"🔍 Did you mean one of these?")
-                for pack_name in similar_names:
-                    console.print(f"    📦 {pack_name}")
-        else:
-            # Print 3 names randomly from the available packs
-            console.print(f"🔍 Did you mean one of these?")
-            random.shuffle(available_names)
-            for pack_name in available_names[:3]:
-                console.print(f"    📦 {pack_name}")
-        
-        # Suggest the user to list all packs
-        console.print("\n✨ Use 'wallpy list' to view all available packs")
+        _suggest_packs(config_manager, name, list(packs))
         return
 
     # If there are multiple packs with the same name, ask for UID
@@ -1378,14 +1224,9 @@ def remove(
     # Check if the pack is in the wallpy packs directory
     is_in_packs_dir = pack.path.is_relative_to(config_manager.packs_dir)
     
-    # Check if pack is directly in custom_wallpacks
-    is_direct_pack = False
-    if "custom_wallpacks" in config_manager.config:
-        custom_wallpacks = dict(config_manager.config["custom_wallpacks"])
-        for pack_name, path in custom_wallpacks.items():
-            if Path(path).resolve() == pack.path:
-                is_direct_pack = True
-                break
+    # Check if pack is directly in custom_wallpacks, and under which name
+    direct_name = _custom_wallpacks_by_path(config_manager).get(pack.path)
+    is_direct_pack = direct_name is not None
 
     # If pack is not directly in custom_wallpacks and not in packs_dir, it's part of an album
     if not is_direct_pack and not is_in_packs_dir:
@@ -1407,11 +1248,7 @@ def remove(
     try:
         # Remove from config if it's a direct pack
         if is_direct_pack:
-            custom_wallpacks = dict(config_manager.config["custom_wallpacks"])
-            for pack_name, path in custom_wallpacks.items():
-                if Path(path).resolve() == pack.path:
-                    del config_manager.config["custom_wallpacks"][pack_name]
-                    break
+            del config_manager.config["custom_wallpacks"][direct_name]
 
         # If in packs directory, delete the pack
         if is_in_packs_dir:
@@ -1441,72 +1278,13 @@ def pack_open(
     If no pack is specified, opens the active pack's folder.
     """
 
-    config_manager = ctx.obj.get("config_manager")
-
-    # If UID is provided, try to get pack by UID first
-    if pack_uid:
-        pack = config_manager.get_pack_by_uid(pack_uid)
-        if not pack:
-            console.print(f"🚫 Pack with UID '{pack_uid}' not found")
-            return
-    else:
-        # Check if pack_name was provided; if not, use the active pack
-        if pack_name == "active":
-            active_pack = ctx.obj.get("active")
-            if not active_pack:
-                console.print("[yellow]No active pack set[/]")
-                return
-            # Get the pack by its UID to ensure we get the correct instance
-            pack = config_manager.get_pack_by_uid(active_pack.uid)
-            if not pack:
-                console.print(f"🚫 Active pack with UID '{active_pack.uid}' not found")
-                return
-        else:
-            # Load packs in the config manager
-            results = config_manager.load_packs()
-            
-            # Check if the pack exists
-            if pack_name not in results:
-                console.print(f"🚫 Pack '{pack_name}' not found")
-
-                # Find similar pack names
-                available_packs = [pack for pack in results.keys() if pack.lower() != "default"]
-                similar_packs = config_manager.find_similar_pack(pack_name, available_packs)
-
-                if similar_packs and len(similar_packs) > 0:
-                    if len(similar_packs) == 1:
-                        console.print(f"🔍 Did you mean '{similar_packs[0]}'?")
-                    else:
-                        console.print(f"🔍 Did you mean one of these?")
-                        for pack in similar_packs:
-                            console.print(f"    📦 {pack}")
-                else:
-                    # Print 3 pack names randomly from the available packs
-                    console.print(f"🔍 Did you mean one of these?")
-                    random.shuffle(available_packs)
-                    for pack in available_packs[:3]:
-                        console.print(f"    📦 {pack}")
-                
-                # Suggest the user to list all packs
-                console.print("\n✨ Use 'wallpy list' to view all available packs")
-                return
-
-            # If there are multiple packs with the same name, ask for UID
-            if len(results[pack_name]) > 1:
-                console.print(f"🔍 Found {len(results[pack_name])} packs named '{pack_name}'")
-                for pack in results[pack_name]:
-                    console.print(f"    📦 {pack.name} [cyan italic]{pack.uid}[/] [dim]({pack.path})[/]")
-                
-                console.print(f"\n✨ Supply the pack's UID using '--uid PACK_UID' to open the pack")
-                return
-
-            # Get the pack object
-            pack = results[pack_name][0]
+    pack = _resolve_pack(ctx, pack_name, pack_uid, "open the pack")
+    if not pack:
+        return
 
     try:
         # Open the pack folder in the system's file explorer
         import subprocess
-        import os
         import platform
 
         # Get the default file explorer based on the platform
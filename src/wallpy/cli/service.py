@@ -3,20 +3,15 @@ Command group of service-related commands for the wallpy-sensei CLI
 """
 
 import typer
-import os
 import sys
 import subprocess
 from pathlib import Path
 from rich import box
 from rich.table import Table
-from rich.console import Console
-from rich.prompt import Confirm
-from wallpy.engine import WallpaperEngine
-from wallpy.config import ConfigManager
-from wallpy.schedule import ScheduleManager
 from wallpy.elevate import isUserAdmin, runAsAdmin
+from wallpy.cli.utils import console, get_ip_location
+
 
-console = Console()
 app = typer.Typer(
     no_args_is_help=True,
     name="service",
@@ -129,13 +124,11 @@ def install(ctx: typer.Context):
         config_manager = ctx.obj.get("config_manager")
         if not config_manager.get_location():
             try:
-                import requests
                 from wallpy.models import Location
                 
-                # Get location from IP silently
-                response = requests.get('http://ipapi.co/json/')
-                if response.status_code == 200:
-                    data = response.json()
+                # Get location from IP silently (cached for a day)
+                data = get_ip_location(config_manager.config_dir)
+                if data:
                     # Create Location object
                     loc = Location(
                         latitude=data.get('latitude'),
@@ -165,11 +158,11 @@ def install(ctx: typer.Context):
                 
             # Get the current wallpaper path
             schedule_file = active_pack.path / "schedule.toml"
-            if not schedule_file.exists():
+            try:
+                schedule = schedule_manager.load_schedule(schedule_file)
+            except FileNotFoundError:
                 # console.print(f"⚠️ [yellow]Schedule file not found at {schedule_file}[/]")
                 return
-                
-            schedule = schedule_manager.load_schedule(schedule_file)
             wallpaper_path = schedule_manager.get_wallpaper(schedule, config_manager.get_location())
             
             if not wallpaper_path:
@@ -3,24 +3,34 @@ Utility functions for the CLI.
 """
 
 import sys
-import typer
+import json
+import time
 import logging
+import functools
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
-from platformdirs import user_config_path
-import logging
+from platformdirs import user_data_path
+
+
+# Shared by every CLI module, rich's terminal detection only needs to run once
+console = Console()
 
-from wallpy.config import ConfigManager
-from wallpy.schedule import ScheduleManager
-from wallpy.engine import WallpaperEngine
-from wallpy.validate import Validator
 
+@functools.lru_cache(maxsize=None)
 def get_app_state(verbose: bool) -> dict:
     """
     Get the current state of the application
+
+    The state is built once per process and shared, so every command works
+    off the same ConfigManager and the config is only parsed once.
     """
-    
-    console = Console()
+
+    # Imported here so that --help and --version don't pay for loading the managers
+    from wallpy.config import ConfigManager
+    from wallpy.schedule import ScheduleManager
+    from wallpy.engine import WallpaperEngine
+    from wallpy.validate import Validator
     
     logger = logging.getLogger("wallpy")
     if verbose:
@@ -68,4 +78,51 @@ def get_app_state(verbose: bool) -> dict:
         "schedule_manager": schedule_manager,
         "engine": wallpaper_engine,
         "validator": validator,
-    }
\ No newline at end of file
+        "logs_dir": user_data_path(appname="wallpy", appauthor=False) / "logs",
+    }
+
+
+def get_ip_location(config_dir: Path, force: bool = False, max_age: int = 24 * 60 * 60) -> Optional[dict]:
+    """
+    Get the location of this machine from its IP address (via ipapi.co)
+
+    The response is cached in the config directory for max_age seconds, since
+    the location rarely changes and the lookup is a network round-trip.
+
+    Args:
+        config_dir (Path): Directory to keep the cache file in
+        force (bool, optional): Skip the cache and look the location up again. Defaults to False.
+        max_age (int, optional): How long a cached response stays valid, in seconds. Defaults to a day.
+
+    Returns:
+        Optional[dict]: The ipapi.co response, or None if the lookup failed
+    """
+
+    cache_file = config_dir / "ipapi_cache.json"
+
+    if not force:
+        try:
+            if time.time() - cache_file.stat().st_mtime < max_age:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass  # No usable cache, look it up again
+
+    import requests
+
+    response = requests.get("http://ipapi.co/json/", timeout=3)
+    if response.status_code != 200:
+        return None
+
+    # ipapi.co reports errors (e.g. rate limiting) with a 200 status, don't cache those
+    data = response.json()
+    if data.get("error") or data.get("latitude") is None:
+        return None
+
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        pass  # Caching is best-effort
+
+    return data
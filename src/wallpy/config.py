@@ -1,25 +1,125 @@
 # config.py
 
+import os
 import sys
+import copy
+import json
 import imghdr
 import shutil
 import logging
 import hashlib
 import difflib
-import tomli, tomli_w
+import functools
+import tempfile
+import tomli_w
 from pathlib import Path
 from dataclasses import dataclass
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
-from platformdirs import user_config_path
-from typing import Dict, List, Optional, TypedDict, Any, DefaultDict
+from platformdirs import user_config_path, user_cache_path
+from typing import Dict, List, Optional, TypedDict, Any, DefaultDict, Tuple, Union
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib
 
 from wallpy.validate import Validator, ValidationResult
 from wallpy.models import PackSearchPaths, Pack, Location
 
 
+# Parsed config files, keyed by path -> (st_mtime_ns, st_size, config)
+# A file is only re-parsed when its stat signature changes
+_PARSE_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config_dir() -> Path:
+    """Returns the user config directory, platformdirs is only asked once per process"""
+    return user_config_path(appname="wallpy", appauthor=False, ensure_exists=True)
+
+
+def _is_empty_dir(path: Path) -> bool:
+    """Returns True if the directory is missing or has no entries, without listing all of it"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except FileNotFoundError:
+        return True
+
+
+def _is_pack_dir(path) -> bool:
+    """Same check as Validator.is_pack, but reads the listing once instead of stat'ing each marker"""
+    has_schedule = has_images = False
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == "schedule.toml":
+                    has_schedule = True
+                elif entry.name == "images" and entry.is_dir():
+                    has_images = True
+    except OSError:
+        # Missing, not a directory or not readable
+        return False
+
+    # There must be at least one image in the images directory
+    return has_schedule and has_images and not _is_empty_dir(os.path.join(path, "images"))
+
+
+def _find_pack_dirs(path: str, children: List[str]) -> List[str]:
+    """Returns the children of path that are packs, keeping their order
+    
+    The children are checked one by one. On local disks each check is a couple of cached
+    directory listings, and a thread pool here measured ~2-3x slower than this loop on a
+    300-pack tree. Callers already run independent roots and albums on their own pool,
+    so this level stays sequential to keep the thread count bounded.
+    """
+    return [name for name in children if _is_pack_dir(os.path.join(path, name))]
+
+
+# Bump when the layout of the on-disk pack scan cache changes
+_SCAN_CACHE_VERSION = 1
+
+
+def _mtime_ns(path) -> Optional[int]:
+    """Returns the mtime of a path in nanoseconds, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan_signature(path: str, children: List[str]) -> list:
+    """Returns the mtimes that change whenever scanning path could give a different result
+    
+    Adding, removing or renaming a pack changes the root's mtime, adding or removing
+    schedule.toml/images changes a child's mtime, and emptying images/ changes its mtime.
+    """
+    signature = [_mtime_ns(path), _mtime_ns(os.path.join(path, "images"))]
+    for name in children:
+        child = os.path.join(path, name)
+        signature.append([name, _mtime_ns(child), _mtime_ns(os.path.join(child, "images"))])
+    return signature
+
+
+def _roots_signature(roots: List[Tuple[Path, Optional[str]]]) -> list:
+    """Returns the mtime of each pack root, which changes when a pack is added to or removed from it"""
+    return [(str(path), _mtime_ns(path)) for path, _ in roots]
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Writes JSON through a temporary file and a rename, so readers never see a partial file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False) as f:
+        json.dump(data, f)
+    os.replace(f.name, path)
+
+
+@functools.lru_cache(maxsize=1024)
 def generate_uid(path: str) -> str:
     # Create a short MD5 hash from the pack's absolute path
+    # UIDs are saved in the config, so the hash can't change, but the same paths come up on every scan
     hash_object = hashlib.md5(path.encode())
     return hash_object.hexdigest()[:6]
 
@@ -33,19 +133,32 @@ class ConfigManager:
     #   - if not for the config manager, the pack manager would have to know where the config is stored + make edits to the config file
     #   - it would have to inevidently use ConfigManager anyway, which just adds an extra layer of abstraction that is unnecessary
 
+    # The CLI builds exactly one ConfigManager (via get_app_state) and shares it through ctx.obj,
+    # subcommands should never construct their own. Set WALLPY_DEBUG_SINGLE_CM=1 to enforce this.
+    _instances = 0
+
     def __init__(self):
         self.logger = logging.getLogger("wallpy.config")
         self.logger.debug("🔧 Initializing ConfigManager")
 
+        if os.environ.get("WALLPY_DEBUG_SINGLE_CM") == "1" and ConfigManager._instances:
+            raise RuntimeError("ConfigManager was instantiated more than once in this process")
+        ConfigManager._instances += 1
+
         self.validator = Validator()
 
         # Get directories and paths
-        self.config_dir = user_config_path(appname="wallpy", appauthor=False, ensure_exists=True)
+        self.config_dir = _default_config_dir()
         # self.logger.debug(f"📝 Config directory: {self.config_dir}")
         self.config_file_path = self.config_dir / "config.toml"
         # self.logger.debug(f"📝 Global Config File: {self.config_file_path}")
         self.packs_dir = self.config_dir / "packs"
         # self.logger.debug(f"📝 Packs directory: {self.packs_dir}")
+        self.scan_cache_path = user_cache_path(appname="wallpy", appauthor=False) / "packs.json"
+        self.uid_index_path = self.scan_cache_path.with_name("uid_index.json")
+        self._saved_uid_index = None  # Contents of uid_index.json as last read or written
+        self._scan_cache = None  # Loaded on first use
+        self._scan_cache_dirty = False
         self.data_dir = files("wallpy.data")
         # self.logger.debug(f"📝 Data directory: {self.data_dir}")
         self.pack_search_paths = PackSearchPaths().get_paths() # could replace with just a func, but having a dataclass seemed in-line with models.py
@@ -58,7 +171,12 @@ class ConfigManager:
         
         # Load config and packs
         self.config = self.load_config()
-        self.wallpacks = self.load_packs() # we're loading the packs initially, but also remember to load them when needed to refresh the list
+        self._uid_index = None  # uid -> Pack, built by load_packs()
+        self._disk_uid_index = None  # uid -> Pack from uid_index.json, read once until load_packs() or invalidate()
+        self._packs_cache = None  # (roots signature, packs) from the last load_packs()
+        self._nondefault_names = None  # Pack names for suggestions, rebuilt after load_packs() finds new packs
+        self._wallpacks = None  # Scanned on first access, see the wallpacks property
+        self._ensure_default_pack()
     
 
     def load_config(self) -> Dict[str, Any]:
@@ -66,24 +184,32 @@ class ConfigManager:
         
         self.logger.debug("🔁 Loading configuration")
 
-        # Create a default config file if it doesn't exist
-        if not self.config_file_path.exists():
-            self.logger.debug("⚠️ Config file not found, creating default")
-            self._create_default_config()
-
-        # Check if the config file is empty
-        if self.config_file_path.stat().st_size == 0:
-            self.logger.debug("⚠️ Config file is empty, creating default")
-            self._create_default_config()
-
         try:
-            # Load the config file
-            with open(self.config_file_path, "rb") as f:
-                config = tomli.load(f)
-                
-                # Cache the config for later use
-                self.config = config
-                return config
+            # A missing or empty config file is replaced by the default one, which the second pass reads
+            for created in (False, True):
+                try:
+                    with open(self.config_file_path, "rb") as f:
+                        stat = os.fstat(f.fileno())
+                        if stat.st_size or created:
+                            # Reuse the parsed config if the file hasn't changed since it was last read
+                            cached = _PARSE_CACHE.get(self.config_file_path)
+                            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                                # Hand out a copy, callers mutate self.config before saving
+                                config = copy.deepcopy(cached[2])
+                            else:
+                                # Load the config file
+                                config = tomllib.load(f)
+                                _PARSE_CACHE[self.config_file_path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(config))
+
+                            # Cache the config for later use
+                            self.config = config
+                            return config
+                    self.logger.debug("⚠️ Config file is empty, creating default")
+                except FileNotFoundError:
+                    if created:
+                        raise
+                    self.logger.debug("⚠️ Config file not found, creating default")
+                self._create_default_config()
 
         except Exception as e:
             self.logger.error(f"💀 Error loading configuration: {str(e)}")
@@ -103,66 +229,122 @@ class ConfigManager:
         self.logger.debug("🔁 Loading wallpacks")
 
         # Create a default pack if none exists
-        if not self.packs_dir.exists() or not any(self.packs_dir.iterdir()):
-            self.logger.debug("⚠️ No packs found, creating default")
-            self._create_default_pack()
+        self._ensure_default_pack()
 
         # Packs can be found in the following ways:
         # 1. In the packs directory
         # 2. In common directories for each OS (e.g. /usr/share/wallpy/packs or ~/Pictures/Wallpapers)
         # 3. In the config file, custom paths can be specified to packs or directories containing packs
         
+        # Collect the directories to search first
+        roots = self._pack_roots(skip_custom)
+
+        # Within a process the packs only need to be rescanned if a root was added, removed or changed
+        signature = _roots_signature(roots)
+        if self._packs_cache is not None and self._packs_cache[0] == signature:
+            self.logger.debug("✅ Wallpacks unchanged since last load")
+            return self._packs_cache[1]
+        
         # We use a defaultdict here to handle duplicates (multiple packs with same name in different dirs)
         packs = defaultdict(list)
         
-        # First we get all packs in the packs directory
-        self.logger.debug("🔍 Searching packs directory")
-        # packs.extend(self.scan_directory(self.packs_dir))
-        packs.update(self.scan_directory(self.packs_dir))
-
-        # Then we get all packs in the common directories
-        self.logger.debug("🔍 Searching common directories")
-        for i, path in enumerate(self.pack_search_paths):
-            for name, pack in self.scan_directory(path, f"#{i+1}").items():
+        # The roots are independent, so they are scanned concurrently to overlap slow storage.
+        # The scan cache is loaded first so the threads don't race to load it
+        self.logger.debug("🔍 Searching pack directories")
+        self._load_scan_cache()
+        with ThreadPoolExecutor(max_workers=min(8, len(roots))) as executor:
+            results = list(executor.map(lambda root: self.scan_directory(*root, use_cache=True), roots))
+
+        # Merge in root order, the packs directory comes first, then the common directories, then the custom paths
+        for result in results:
+            for name, pack in result.items():
                 packs[name].extend(pack)
-
-        # Finally we get all packs in the custom paths specified in the config
-        if (not skip_custom) and ("custom_wallpacks" in self.config):
-            self.logger.debug("🔍 Searching custom directories")
-            custom_paths = self.config["custom_wallpacks"]
-
-            # Check each custom path
-            for name, path in custom_paths.items():
-                # Check if the path is relative
-                if not Path(path).is_absolute():
-                    path = self.config_dir / path
-                else:
-                    path = Path(path)
-
-                for name, pack in self.scan_directory(path, name).items():
-                    packs[name].extend(pack)
             
         self.logger.debug(f"✅ Wallpacks loaded ({len(packs)} found)")
 
+        # Persist the scan results so the next run can skip unchanged directories
+        self._save_scan_cache([path for path, _ in roots])
+
         # Remove duplicate packs by UID
         # We'll keep the first occurrence of each UID and remove any duplicates
-        seen_uids = set()
+        # The UIDs we keep double as the index for get_pack_by_uid
+        uid_index = {}
         unique_packs = defaultdict(list)
         
         for name, pack_list in packs.items():
             for pack in pack_list:
-                if pack.uid not in seen_uids:
-                    seen_uids.add(pack.uid)
+                if pack.uid not in uid_index:
+                    uid_index[pack.uid] = pack
                     unique_packs[name].append(pack)
                 else:
                     self.logger.debug(f"Removing duplicate pack: {pack.name} ({pack.uid}) at {pack.path}")
 
         # Cache the packs for later use
         self.wallpacks = unique_packs
+        self._uid_index = uid_index
+        self._disk_uid_index = None
+        self._packs_cache = (signature, unique_packs)
+        self._nondefault_names = None
+
+        # A full load also refreshes the on-disk UID index
+        if not skip_custom:
+            self._save_uid_index(signature, uid_index)
 
         return unique_packs
 
 
+    @property
+    def wallpacks(self) -> Dict[str, List[Pack]]:
+        """The packs found by the last load_packs(), the directories are only scanned once something needs them"""
+        if self._wallpacks is None:
+            self.load_packs()
+        return self._wallpacks
+
+
+    @wallpacks.setter
+    def wallpacks(self, packs: Dict[str, List[Pack]]) -> None:
+        self._wallpacks = packs
+
+
+    def _ensure_default_pack(self) -> None:
+        """Creates the default pack if the packs directory is empty, the active pack may point at it"""
+        if _is_empty_dir(self.packs_dir):
+            self.logger.debug("⚠️ No packs found, creating default")
+            self._create_default_pack()
+
+
+    def _pack_roots(self, skip_custom: bool = False) -> List[Tuple[Path, Optional[str]]]:
+        """Returns the directories to search for packs, each with a nickname for logging"""
+        roots = [(self.packs_dir, None)]
+        roots.extend((path, f"#{i+1}") for i, path in enumerate(self.pack_search_paths))
+
+        custom_paths = None if skip_custom else self.config.get("custom_wallpacks")
+        if custom_paths:
+            for name, path in custom_paths.items():
+                # Check if the path is relative
+                path = Path(path)
+                if not path.is_absolute():
+                    path = self.config_dir / path
+                roots.append((path, name))
+
+        return roots
+
+
+    def get_nondefault_pack_names(self) -> Tuple[str, ...]:
+        """Returns the names of the loaded packs except the default pack, to suggest to the user"""
+        if self._nondefault_names is None:
+            self._nondefault_names = tuple(name for name in self.wallpacks if name.lower() != "default")
+        return self._nondefault_names
+
+
+    def invalidate(self) -> None:
+        """Forgets the packs found by the last load_packs() and the lookups built from them, so the next call scans again"""
+        self._packs_cache = None
+        self._uid_index = None
+        self._disk_uid_index = None
+        self._nondefault_names = None
+
+
     def _create_default_config(self) -> None:
         """Creates a default configuration file"""
         
@@ -172,7 +354,8 @@ class ConfigManager:
         self.logger.debug(f"🔁 Copying default config")
         
         try:
-            shutil.copy(default_config_path, self.config_file_path)
+            # copyfile skips the chmod that copy() does, permissions come from the umask
+            shutil.copyfile(default_config_path, self.config_file_path)
             self.logger.debug("✅ Default configuration created")
         except Exception as e:
             self.logger.error(f"💀 Error copying default config: {str(e)}")
@@ -191,68 +374,219 @@ class ConfigManager:
         self.logger.debug(f"🔁 Copying default pack")
         
         try:
-            shutil.copytree(default_pack_path, default_pack_dest, dirs_exist_ok=True)
+            shutil.copytree(default_pack_path, default_pack_dest, copy_function=shutil.copyfile, dirs_exist_ok=True)
             self.logger.debug("✅ Default pack created")
         except Exception as e:
             self.logger.error(f"💀 Error copying default pack: {str(e)}")
     
     
-    def scan_directory(self, path: Path, path_nick: str = None) -> DefaultDict[str, List[Pack]]:
+    def scan_directory(self, path: Path, path_nick: str = None, use_cache: bool = False) -> DefaultDict[str, List[Pack]]:
         """Finds all packs in a given path
         
         Args:
             path (Path): The path to search for packs
             path_nick (str, optional): A nickname for the path. Defaults to None.
+            use_cache (bool, optional): Reuse the last scan of this path if nothing in it has changed. Defaults to False.
         """
         
         packs = defaultdict(list)
 
-        # Check if the path exists or is not a directory
-        if not path.exists() or not path.is_dir():
-            return packs
+        # No is_dir() check up front, a missing path or a plain file can't match a cached
+        # signature and makes the listing below fail
+        key = str(path)
+        if use_cache:
+            cached = self._load_scan_cache().get(key)
+            if cached and _scan_signature(key, cached["children"]) == cached["signature"]:
+                for name, pack_path, uid in cached["packs"]:
+                    packs[name].append(Pack(name=name, path=Path(pack_path), uid=uid))
+                return packs
         
-        # Check if the path is a pack
-        if self.validator.is_pack(path):
-            # self.logger.debug(f"    📦 {path.name} (in {path_nick})" if path_nick else f"    📦 {path.name}")
-            pack = Pack(name=path.name, path=path.resolve(), uid=generate_uid(str(path.resolve())))
-            packs[path.name].append(pack)
-        else:    
-            # Check if the path contains any packs
-            for item in path.iterdir():
-                if self.validator.is_pack(item):
-                    # self.logger.debug(f"    📦 {item.name} (in {path_nick})" if path_nick else f"    📦 {item.name}")
-                    pack = Pack(name=item.name, path=item.resolve(), uid=generate_uid(str(item.resolve())))
-                    packs[item.name].append(pack)
+        # Check if the path is a pack, otherwise check if it contains any packs.
+        # One listing of the root answers both, and scandir gives us the entry type
+        # without an extra stat so plain files are skipped cheaply
+        has_schedule = False
+        children, symlinks = [], set()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name == "schedule.toml":
+                        has_schedule = True
+                    elif entry.is_dir():
+                        children.append(entry.name)
+                        if entry.is_symlink():
+                            symlinks.add(entry.name)
+        except OSError:
+            # Missing, not a directory or not readable
+            return packs
+
+        # Same check as _is_pack_dir, there must be at least one image in the images directory
+        is_pack = has_schedule and "images" in children and not _is_empty_dir(os.path.join(key, "images"))
+        if is_pack:
+            children = []
+
+        # Take the signature before resolving, so a change made mid-scan invalidates it
+        signature = _scan_signature(key, children) if use_cache else None
+
+        # The root is resolved once, a child only needs its own realpath() if it's a symlink.
+        # Paths stay strings until the Pack is built, the UID is hashed from the string anyway
+        resolved_root = os.path.realpath(key)
+        if is_pack:
+            candidates = [(path.name, resolved_root)]
+        else:
+            candidates = [
+                (name, os.path.realpath(os.path.join(key, name)) if name in symlinks else os.path.join(resolved_root, name))
+                for name in _find_pack_dirs(key, children)
+            ]
+
+        for name, resolved in candidates:
+            # self.logger.debug(f"    📦 {name} (in {path_nick})" if path_nick else f"    📦 {name}")
+            pack = Pack(name=name, path=Path(resolved), uid=generate_uid(resolved))
+            packs[name].append(pack)
+
+        if use_cache:
+            self._scan_cache[key] = {
+                "signature": signature,
+                "children": children,
+                "packs": [[pack.name, str(pack.path), pack.uid] for pack_list in packs.values() for pack in pack_list],
+            }
+            self._scan_cache_dirty = True
         
         return packs
-    
 
+
+    def count_packs(self, path: Union[str, Path]) -> int:
+        """Counts the packs scan_directory() would find in a path, without resolving them or building Packs"""
+        has_schedule = False
+        children = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name == "schedule.toml":
+                        has_schedule = True
+                    elif entry.is_dir():
+                        children.append(entry.name)
+        except OSError:
+            # Missing, not a directory or not readable
+            return 0
+
+        if has_schedule and "images" in children and not _is_empty_dir(os.path.join(path, "images")):
+            return 1
+        return len(_find_pack_dirs(os.fspath(path), children))
+
+
+    def _load_scan_cache(self) -> Dict[str, Any]:
+        """Loads the on-disk cache of directory scans, keyed by the scanned path"""
+        if self._scan_cache is None:
+            self._scan_cache = {}
+            try:
+                with open(self.scan_cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == _SCAN_CACHE_VERSION:
+                    self._scan_cache = data["roots"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass  # No usable cache, everything gets scanned
+        return self._scan_cache
+
+
+    def _save_scan_cache(self, roots: List[Path]) -> None:
+        """Writes the scan cache for the given paths, atomically so readers never see a partial file"""
+        roots = [str(root) for root in roots if str(root) in self._load_scan_cache()]
+        if not self._scan_cache_dirty and set(roots) == set(self._scan_cache):
+            return
+
+        data = {"version": _SCAN_CACHE_VERSION, "roots": {root: self._scan_cache[root] for root in roots}}
+        try:
+            _write_json_atomic(self.scan_cache_path, data)
+            self._scan_cache_dirty = False
+        except OSError as e:
+            self.logger.debug(f"⚠️ Could not write the pack scan cache: {str(e)}")
+
+
+    def _load_uid_index(self) -> Dict[str, List[str]]:
+        """Loads the on-disk UID index, if it was written for the current pack roots
+        
+        Returns a dict of uid -> [name, path], empty if the index is missing or stale.
+        """
+        try:
+            with open(self.uid_index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._saved_uid_index = data  # Lets _save_uid_index skip reading it again
+            if data.get("version") != _SCAN_CACHE_VERSION:
+                return {}
+            # JSON turns the signature's tuples into lists
+            signature = [list(entry) for entry in _roots_signature(self._pack_roots())]
+            return data["packs"] if data["signature"] == signature else {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+
+
+    def _save_uid_index(self, signature: list, uid_index: Dict[str, Pack]) -> None:
+        """Writes the UID index with the roots signature it is valid for"""
+        data = {
+            "version": _SCAN_CACHE_VERSION,
+            "signature": [list(entry) for entry in signature],
+            "packs": {uid: [pack.name, str(pack.path)] for uid, pack in uid_index.items()},
+        }
+
+        # Only write when the index changed, compared against what's on disk the first time
+        if self._saved_uid_index is None:
+            try:
+                with open(self.uid_index_path, "r", encoding="utf-8") as f:
+                    self._saved_uid_index = json.load(f)
+            except (OSError, ValueError):
+                self._saved_uid_index = {}
+        if data == self._saved_uid_index:
+            return
+
+        try:
+            _write_json_atomic(self.uid_index_path, data)
+            self._saved_uid_index = data
+        except OSError as e:
+            self.logger.debug(f"⚠️ Could not write the UID index: {str(e)}")
+
+    
     def get_pack_by_uid(self, pack_uid: str) -> Optional[Pack]:
         """Gets a pack by its unique identifier"""
 
-        self.load_packs()
+        # The index is rebuilt on every load_packs(), only load if that hasn't happened yet
+        if self._uid_index is None:
+            # The on-disk index can answer without a scan, as long as the pack is still there.
+            # It's read once, later lookups before a scan reuse it
+            if self._disk_uid_index is None:
+                self._disk_uid_index = {
+                    uid: Pack(name=name, path=Path(path), uid=uid)
+                    for uid, (name, path) in self._load_uid_index().items()
+                }
+            pack = self._disk_uid_index.get(pack_uid)
+            if pack and _is_pack_dir(pack.path):
+                return pack
+            self.load_packs()
         
-        for packs in self.wallpacks.values():
-            for pack in packs:
-                if pack.uid == pack_uid:
-                    return pack
-        else:
-            return None
+        return self._uid_index.get(pack_uid)
         
 
     def find_similar_pack(self, pack_name: str, available_packs: List[str]) -> List[str]:
         """Finds similar pack names from a list of available packs"""
             
-        pack_name = pack_name.lower().strip()        
-        matches = difflib.get_close_matches(pack_name, available_packs, n=3, cutoff=0.2)
-        return matches
+        pack_name = pack_name.lower().strip()
+
+        try:
+            # RapidFuzz is optional (the "fuzzy" extra), its matching runs in C and is much faster than difflib
+            from rapidfuzz import process, fuzz
+            # Lowercase each candidate once up front, with a dict the original name comes back as the key
+            choices = {name: name.lower() for name in available_packs}
+            matches = process.extract(pack_name, choices, scorer=fuzz.WRatio, processor=None, limit=3, score_cutoff=60)
+            return [name for lowered, score, name in matches]
+        except ImportError:
+            # If rapidfuzz is not available, fall back to difflib
+            return difflib.get_close_matches(pack_name, available_packs, n=3, cutoff=0.2)
     
 
     def get_active_pack(self) -> Pack:
         """Gets the active wallpaper pack from the config"""
         
-        if "active" in self.config:
-            active = self.config["active"]
+        active = self.config.get("active")
+        if active:
             pack_name = active.get("name")
             pack_path = Path(active.get("path"))
             pack_uid = active.get("uid")
@@ -327,12 +661,14 @@ class ConfigManager:
             # Verify the file can be read back
             try:
                 with open(self.config_file_path, "rb") as f:
-                    tomli.load(f)
+                    tomllib.load(f)
             except Exception as e:
                 self.logger.error(f"💀 Config file verification failed: {str(e)}")
                 return False
                 
             self.logger.debug("✅ Configuration saved")
+            # Custom pack paths may have changed
+            self.invalidate()
             return True
             
         except Exception as e:
@@ -341,8 +677,8 @@ class ConfigManager:
 
     def get_location(self) -> Optional[Location]:
         """Gets the global location from the config"""
-        if "location" in self.config:
-            loc_data = self.config["location"]
+        loc_data = self.config.get("location")
+        if loc_data:
             return Location(
                 name=loc_data.get("name", "New Delhi"),
                 region=loc_data.get("region", "Asia"),
@@ -1,19 +1,64 @@
 # engine.py
+import os
 import sys
 import logging
+import functools
 from pathlib import Path
+from string import Template
 from typing import Literal
 
+
+@functools.lru_cache(maxsize=1)
+def _desktop_env() -> str:
+    """Returns the current desktop environment, it doesn't change during a session"""
+    return os.environ.get("XDG_CURRENT_DESKTOP", "").upper()
+
+
+@functools.lru_cache(maxsize=1)
+def _system_parameters_info():
+    """Returns user32.SystemParametersInfoW with its prototype set up, Windows only"""
+    import ctypes
+    from ctypes import wintypes
+    func = ctypes.WinDLL("user32", use_last_error=True).SystemParametersInfoW
+    func.argtypes = [wintypes.UINT, wintypes.UINT, wintypes.LPCWSTR, wintypes.UINT]
+    func.restype = wintypes.BOOL
+    return func
+
+
+# Script templates, only the image path changes between calls
+_MACOS_SCRIPT = Template('''
+tell application "System Events"
+    set desktopCount to count of desktops
+    repeat with desktopNumber from 1 to desktopCount
+        tell desktop desktopNumber
+            set picture to "$path"
+        end tell
+    end repeat
+end tell
+''')
+
+_KDE_SCRIPT = Template(
+    "string:var allDesktops = desktops(); for (i=0;i<allDesktops.length;i++) { "
+    "d = allDesktops[i]; d.wallpaperPlugin = 'org.kde.image'; "
+    "d.currentConfigGroup = Array('Wallpaper', 'org.kde.image', 'General'); "
+    "d.writeConfig('Image', 'file://$path')}"
+)
+
+
 class WallpaperEngine:
     def __init__(self):
         self.platform: Literal["win32", "darwin", "linux"] = sys.platform
         self.logger = logging.getLogger("wallpaper_engine")
+        self._gio_settings = None  # Lazily created GNOME background settings, False if unavailable
         
     def set_wallpaper(self, image_path: Path) -> bool:
         """Returns True on success, False on failure"""
         try:
-            image_path = image_path.expanduser().resolve()
-            if not image_path.exists():
+            # abspath is pure string work, the OS wallpaper APIs follow symlinks themselves
+            image_path = Path(os.path.abspath(os.path.expanduser(image_path)))
+
+            # Still check the file is there, gsettings happily accepts a missing path
+            if not os.path.isfile(image_path):
                 self.logger.error(f"Image not found: {image_path}")
                 return False
 
@@ -34,9 +79,11 @@ class WallpaperEngine:
         try:
             import ctypes
             SPI_SETDESKWALLPAPER = 20
-            ctypes.windll.user32.SystemParametersInfoW(
-                SPI_SETDESKWALLPAPER, 0, str(path), 3
-            )
+            SPIF_UPDATEINIFILE_SENDCHANGE = 3
+            if not _system_parameters_info()(
+                SPI_SETDESKWALLPAPER, 0, str(path), SPIF_UPDATEINIFILE_SENDCHANGE
+            ):
+                raise ctypes.WinError(ctypes.get_last_error())
             return True
         except Exception as e:
             self.logger.error(f"Windows API error: {e}")
@@ -46,16 +93,9 @@ class WallpaperEngine:
     def _set_macos_wallpaper(self, path: Path) -> bool:
         try:
             import subprocess
-            script = f'''
-            tell application "System Events"
-                set desktopCount to count of desktops
-                repeat with desktopNumber from 1 to desktopCount
-                    tell desktop desktopNumber
-                        set picture to "{path}"
-                    end tell
-                end repeat
-            end tell
-            '''
+            # Escape the path for an AppleScript string literal
+            escaped = str(path).replace("\\", "\\\\").replace('"', '\\"')
+            script = _MACOS_SCRIPT.substitute(path=escaped)
             subprocess.run(["osascript", "-e", script], check=True)
             return True
         except subprocess.CalledProcessError as e:
@@ -69,6 +109,13 @@ class WallpaperEngine:
             import subprocess
             # Try GNOME first
             if self._check_gnome():
+                # Prefer setting it in-process through PyGObject, if it's installed
+                settings = self._get_gio_settings()
+                if settings and settings.set_string("picture-uri", f"file://{path}"):
+                    from gi.repository import Gio
+                    Gio.Settings.sync()  # Flush to dconf before the process exits
+                    return True
+
                 subprocess.run([
                     "gsettings", "set", 
                     "org.gnome.desktop.background", 
@@ -78,14 +125,13 @@ class WallpaperEngine:
             
             # Try KDE
             if self._check_kde():
+                # Escape the path for a single-quoted JavaScript string
+                escaped = str(path).replace("\\", "\\\\").replace("'", "\\'")
                 subprocess.run([
                     "dbus-send", "--session", "--dest=org.kde.plasmashell",
                     "--type=method_call", "/PlasmaShell", 
                     "org.kde.PlasmaShell.evaluateScript", 
-                    f"string:var allDesktops = desktops(); for (i=0;i<allDesktops.length;i++) {{ \
-                    d = allDesktops[i]; d.wallpaperPlugin = 'org.kde.image'; \
-                    d.currentConfigGroup = Array('Wallpaper', 'org.kde.image', 'General'); \
-                    d.writeConfig('Image', 'file://{path}')}}"
+                    _KDE_SCRIPT.substitute(path=escaped)
                 ], check=True)
                 return True
             
@@ -96,24 +142,24 @@ class WallpaperEngine:
             self.logger.error(f"Linux command failed: {e}")
             return False
 
+    def _get_gio_settings(self):
+        """Returns the GNOME background Gio.Settings, or None if PyGObject or the schema is missing"""
+        if self._gio_settings is None:
+            self._gio_settings = False
+            try:
+                from gi.repository import Gio
+                # Gio.Settings.new() aborts the process on an unknown schema, so look it up first
+                source = Gio.SettingsSchemaSource.get_default()
+                if source and source.lookup("org.gnome.desktop.background", True):
+                    self._gio_settings = Gio.Settings.new("org.gnome.desktop.background")
+            except (ImportError, ValueError) as e:
+                self.logger.debug(f"PyGObject not available, using gsettings: {e}")
+        return self._gio_settings or None
+
     def _check_gnome(self) -> bool:
         """Check if GNOME desktop is running"""
-        try:
-            import subprocess
-            return "GNOME" in subprocess.check_output(
-                ["echo", "$XDG_CURRENT_DESKTOP"], 
-                shell=True
-            ).decode().upper()
-        except:
-            return False
+        return "GNOME" in _desktop_env()
 
     def _check_kde(self) -> bool:
         """Check if KDE Plasma is running"""
-        try:
-            import subprocess
-            return "KDE" in subprocess.check_output(
-                ["echo", "$XDG_CURRENT_DESKTOP"], 
-                shell=True
-            ).decode().upper()
-        except:
-            return False
\ No newline at end of file
+        return "KDE" in _desktop_env()
@@ -4,6 +4,7 @@ from pathlib import Path
 from datetime import time
 from enum import Enum, auto
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Union, Dict, List, Any
 from collections import defaultdict
 
@@ -66,6 +67,11 @@ class DaySchedule:
     images: List[Path]
     shuffle: bool = False
     
+    @cached_property
+    def image_set(self) -> frozenset:
+        """The day's images as a set, for membership checks"""
+        return frozenset(self.images)
+    
     def __str__(self) -> str:
         """Human-readable representation of the day schedule"""
         return f"{len(self.images)} images" + (" (shuffled)" if self.shuffle else "")
@@ -1,10 +1,19 @@
 # schedule.py
+import os
 import re
-import tomli
+import pickle
+import hashlib
+import tempfile
 from datetime import datetime, time, date, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List
 import logging
+from platformdirs import user_cache_path
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib
 
 from wallpy.models import (
     Schedule, ScheduleType, TimeSpec, TimeSpecType, 
@@ -24,6 +33,9 @@ SOLAR_FALLBACKS = {
 
 ACCEPTED_SOLAR_EVENTS = set(SOLAR_FALLBACKS.keys())
 
+# Bump when the models change shape, so parsed schedules pickled by an older version are ignored
+SCHEDULE_CACHE_VERSION = 1
+
 SOLAR_TIME_REGEX = re.compile(
     r"^(?P<event>\w+)"          # Solar event name
     r"(?:(?P<op>[+-])"          # Optional operator
@@ -37,6 +49,7 @@ class SolarTimeCalculator:
     
     def __init__(self):
         self._cache = {}  # Cache for solar calculations
+        self._sun_cache = {}  # All solar events for a (date, location), astral computes them in one go
         self._error_cache = set()  # Cache for known errors to avoid repeated warnings
         self.logger = logging.getLogger(__name__)
     
@@ -86,15 +99,11 @@ class SolarTimeCalculator:
         error_key = f"timezone:{location.timezone}"
         
         try:
-            from astral import LocationInfo, sun
-            location_info = LocationInfo(location.name, location.region, location.timezone, location.latitude, location.longitude)
-            
             # Handle different ways to get solar times
             if event == "midnight":
                 result = time(0, 0)
             else:
-                sun_object = sun.sun(location_info.observer, date=date_obj, tzinfo=location.timezone)
-                result = sun_object[event].time()
+                result = self._sun_events(date_obj, location)[event].time()
                 
             # Cache the result
             self._cache[cache_key] = result
@@ -110,6 +119,17 @@ class SolarTimeCalculator:
                     self.logger.warning(f"Failed to calculate solar time for {event}: {e}")
                 self.logger.warning("Using fallback solar times instead\n")
             return self.get_fallback_time(event)
+
+    def _sun_events(self, date_obj: date, location: Location) -> Dict[str, datetime]:
+        """Calculate every solar event for a date and location once, later events reuse the result"""
+        sun_key = (date_obj, location.latitude, location.longitude, location.timezone)
+        events = self._sun_cache.get(sun_key)
+        if events is None:
+            from astral import LocationInfo, sun
+            location_info = LocationInfo(location.name, location.region, location.timezone, location.latitude, location.longitude)
+            events = sun.sun(location_info.observer, date=date_obj, tzinfo=location.timezone)
+            self._sun_cache[sun_key] = events
+        return events
     
     def resolve_datetime(
         self, 
@@ -131,6 +151,16 @@ class SolarTimeCalculator:
         )
         return datetime.combine(base_date, solar_time) + timedelta(minutes=spec.offset)
 
+    def resolve_many(
+        self,
+        specs: List[TimeSpec],
+        base_date: date,
+        location: Union[Location, Dict[str, Any], None]
+    ) -> List[datetime]:
+        """Convert several TimeSpecs for the same date and location, converting the location only once"""
+        location_obj = self._convert_location(location)
+        return [self.resolve_datetime(spec, base_date, location_obj) for spec in specs]
+
 class ScheduleManager:
     """Main class for schedule operations"""
     
@@ -138,17 +168,70 @@ class ScheduleManager:
         self.logger = logging.getLogger(__name__)
         self.solar_calculator = SolarTimeCalculator()
         self.validator = ScheduleValidator(self.solar_calculator)
+        self.cache_dir = user_cache_path(appname="wallpy", appauthor=False) / "schedules"
+        self._schedules = {}  # abspath -> (header, Schedule), so the service loop skips even the pickle
     
     def load_schedule(self, path: Path) -> Schedule:
         """Load and parse schedule file"""
         self.logger.debug(f"Loading schedule from {path}")
-        return self._parse_file(path)
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # Raised as is, so callers can tell a missing schedule apart from a broken one
+            self.logger.debug(f"Schedule file not found at {path}")
+            raise
+        except OSError:
+            # Let the parser report the unreadable file
+            return self._parse_file(path)
+
+        # Parsed schedules are cached per file, and reused while its mtime and size are unchanged
+        abspath = os.path.abspath(path)
+        header = (SCHEDULE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        cached = self._schedules.get(abspath)
+        if cached and cached[0] == header:
+            return cached[1]
+
+        cache_file = self.cache_dir / f"{hashlib.md5(abspath.encode()).hexdigest()}.pickle"
+        schedule = self._read_cached_schedule(cache_file, header)
+        if schedule is None:
+            schedule = self._parse_file(path)
+            self._write_cached_schedule(cache_file, header, schedule)
+        self._schedules[abspath] = (header, schedule)
+        return schedule
+
+    def _read_cached_schedule(self, cache_file: Path, header: tuple) -> Optional[Schedule]:
+        """Returns the cached schedule if its header matches, otherwise None"""
+        try:
+            with open(cache_file, "rb") as f:
+                # The header is pickled on its own, so a stale cache is rejected without loading the schedule
+                if pickle.load(f) != header:
+                    return None
+                schedule = pickle.load(f)
+            self.logger.debug(f"Loaded cached schedule from {cache_file}")
+            return schedule if isinstance(schedule, Schedule) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable schedule cache {cache_file}: {e}")
+            return None
+
+    def _write_cached_schedule(self, cache_file: Path, header: tuple, schedule: Schedule) -> None:
+        """Writes the parsed schedule to the cache, atomically so readers never see a partial file"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(schedule, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_file)
+        except Exception as e:
+            self.logger.debug(f"Could not write the schedule cache {cache_file}: {e}")
     
     def _parse_file(self, path: Path) -> Schedule:
         """Parse a schedule file into a Schedule object"""
         try:
             with open(path, "rb") as f:
-                data = tomli.load(f)
+                data = tomllib.load(f)
             self.logger.debug(f"Loaded schedule file from {path}")
         except Exception as e:
             self.logger.error(f"Failed to load schedule file from {path}: {e}")
@@ -294,9 +377,9 @@ class ScheduleManager:
             offset=offset
         )
 
-    def get_block(self, schedule: Schedule, global_location: Union[Location, Dict[str, Any], None] = None, get_next: bool = False) -> Optional[TimeBlock]:
-        """Get the current or next timeblock based on the current time"""
-        when = datetime.now()
+    def get_block(self, schedule: Schedule, global_location: Union[Location, Dict[str, Any], None] = None, get_next: bool = False, when: Optional[datetime] = None) -> Optional[TimeBlock]:
+        """Get the current or next timeblock based on the current time, or on `when` if given"""
+        when = when or datetime.now()
         test_date = when.date()
         
         if schedule.meta.type != ScheduleType.TIMEBLOCKS or not schedule.timeblocks:
@@ -307,9 +390,7 @@ class ScheduleManager:
             future_blocks = []
             
             # First check blocks on the current date
-            for block in schedule.timeblocks.values():
-                start = self.solar_calculator.resolve_datetime(block.start, test_date, global_location)
-                end = self.solar_calculator.resolve_datetime(block.end, test_date, global_location)
+            for block, start, end in self._block_spans(schedule, test_date, global_location):
                 if end <= start:
                     end += timedelta(days=1)
                 if start > when:
@@ -318,9 +399,7 @@ class ScheduleManager:
             # If no future blocks found on current date, check blocks on next date
             if not future_blocks:
                 next_date = test_date + timedelta(days=1)
-                for block in schedule.timeblocks.values():
-                    start = self.solar_calculator.resolve_datetime(block.start, next_date, global_location)
-                    end = self.solar_calculator.resolve_datetime(block.end, next_date, global_location)
+                for block, start, end in self._block_spans(schedule, next_date, global_location):
                     if end <= start:
                         end += timedelta(days=1)
                     future_blocks.append((start, block))
@@ -336,10 +415,7 @@ class ScheduleManager:
             return first_block
         else:
             # Find current block
-            for block in schedule.timeblocks.values():
-                start = self.solar_calculator.resolve_datetime(block.start, test_date, global_location)
-                end = self.solar_calculator.resolve_datetime(block.end, test_date, global_location)
-                
+            for block, start, end in self._block_spans(schedule, test_date, global_location):
                 self.logger.debug(f"Block: {block.name}, Start: {start}, End: {end}, When: {when}")
                 
                 # Handle midnight crossing
@@ -358,6 +434,14 @@ class ScheduleManager:
                     
             return None
 
+    def _block_spans(self, schedule: Schedule, test_date: date, global_location: Union[Location, Dict[str, Any], None] = None) -> List[tuple[TimeBlock, datetime, datetime]]:
+        """Resolve the start and end of every timeblock on test_date in one batch, as (block, start, end)"""
+        blocks = list(schedule.timeblocks.values())
+        times = self.solar_calculator.resolve_many(
+            [spec for block in blocks for spec in (block.start, block.end)], test_date, global_location
+        )
+        return [(block, times[2 * i], times[2 * i + 1]) for i, block in enumerate(blocks)]
+
     def _get_image_index(self, block: TimeBlock, when: datetime, start: datetime, end: datetime, is_next: bool = False) -> int:
         """Calculate which image should be shown based on time and shuffle settings"""
         if block.shuffle:
@@ -391,14 +475,14 @@ class ScheduleManager:
         
         return start, end, image_duration
 
-    def get_wallpaper(self, schedule: Schedule, global_location: Union[Location, Dict[str, Any], None] = None, include_time: bool = False, get_next: bool = False) -> Union[Optional[Path], tuple[Optional[Path], Optional[datetime], Optional[datetime]]]:
-        """Get the current or next wallpaper based on the schedule type and current time"""
-        when = datetime.now()
+    def get_wallpaper(self, schedule: Schedule, global_location: Union[Location, Dict[str, Any], None] = None, include_time: bool = False, get_next: bool = False, when: Optional[datetime] = None) -> Union[Optional[Path], tuple[Optional[Path], Optional[datetime], Optional[datetime]]]:
+        """Get the current or next wallpaper based on the schedule type and current time, or on `when` if given"""
+        when = when or datetime.now()
         test_date = when.date()
         
         if schedule.meta.type == ScheduleType.TIMEBLOCKS:
-            current_block = self.get_block(schedule, global_location)
-            next_block = self.get_block(schedule, global_location, True)
+            current_block = self.get_block(schedule, global_location, when=when)
+            next_block = self.get_block(schedule, global_location, True, when=when)
             
             if get_next:
                 if current_block and current_block.images:
@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 from pathlib import Path
 from platformdirs import user_data_path
 
@@ -10,8 +11,10 @@ def main():
     # Setup logging
     log_dir = user_data_path(appname="wallpy", appauthor=False, ensure_exists=True) / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
+    # A watched handler reopens wallpy.log after 'wallpy logs clear' moves it to a backup,
+    # instead of writing on into the backup
     logging.basicConfig(
-        filename=log_dir / "wallpy.log",
+        handlers=[logging.handlers.WatchedFileHandler(log_dir / "wallpy.log")],
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
@@ -1,7 +1,6 @@
 # validate.py
 import sys
 import imghdr
-import tomli
 import logging
 from PIL import Image
 from typing import List, Optional, Dict, Any, Union, Tuple
@@ -13,6 +12,11 @@ from collections import defaultdict
 import re
 from difflib import get_close_matches
 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib
+
 from wallpy.models import Schedule, TimeSpecType, ScheduleType, Location, ValidationResult, Pack
 
 # Solar time constants
@@ -684,7 +688,7 @@ class Validator:
         
         # Check if the pack has a images directory
         images_dir = self.file / "images"
-        if not images_dir.exists() or not images_dir.is_dir():
+        if not images_dir.is_dir():  # False for a missing path too
             result.add("images_missing", "error", f"{self.file} is missing images directory")
             return result
         
@@ -693,19 +697,24 @@ class Validator:
             result.add("images_empty", "error", f"{self.file} has no images")
             return result
         
-        # Check if the schedule.toml is valid
+        # Check if the schedule.toml is valid, opening it tells us if it's missing without a separate stat
         schedule_file = self.file / "schedule.toml"
-        if not schedule_file.exists():
-            result.add("schedule_missing", "error", f"{self.file} is missing schedule.toml")
-            return result
-        
+        schedule = None
         try:
             with schedule_file.open("rb") as f:
-                schedule = tomli.load(f)
-                result.merge(self.validate_schedule(schedule, self.file))
+                schedule = tomllib.load(f)
+        except FileNotFoundError:
+            result.add("schedule_missing", "error", f"{self.file} is missing schedule.toml")
+            return result
         except Exception as e:
             result.add("schedule_invalid", "error", f"{self.file} schedule.toml is invalid: {str(e)}")
         
+        if schedule is not None:
+            try:
+                result.merge(self.validate_schedule(schedule, self.file))
+            except Exception as e:
+                result.add("schedule_invalid", "error", f"{self.file} schedule.toml is invalid: {str(e)}")
+        
         # Check if the images are valid
         images_dir = self.file / "images"
         for img in images_dir.iterdir():
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+import typer
+
+from wallpy.cli import config
+
+
+class TestConfigCLI:
+    """Tests for the config CLI commands"""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="reads keys through termios")
+    def test_key_reader_treats_closed_stdin_as_escape(self, monkeypatch):
+        """Test that reading keys aborts with Escape once stdin hits EOF instead of spinning."""
+        import pty
+
+        master, slave = pty.openpty()
+        try:
+            with os.fdopen(slave, "r", closefd=False) as stdin:
+                monkeypatch.setattr(sys, "stdin", stdin)
+                monkeypatch.setattr(os, "read", lambda fd, n: b"")
+                with config._key_reader() as (read_key, key_ready):
+                    assert read_key() == "\x1b"
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    def test_search_without_terminal_exits(self, monkeypatch, capsys):
+        """Test that the location search refuses to start when stdin is not a terminal."""
+        monkeypatch.setattr(sys.stdin, "isatty", lambda: False, raising=False)
+        monkeypatch.setattr(config, "_run_location_wizard", lambda ctx: pytest.fail("wizard started"))
+        with pytest.raises(typer.Exit):
+            config.search(None)
+        assert "interactive terminal" in capsys.readouterr().out
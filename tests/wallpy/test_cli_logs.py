@@ -0,0 +1,49 @@
+import zipfile
+from types import SimpleNamespace
+
+from rich.text import Text
+
+from wallpy.cli import logs
+
+
+class TestLogsCLI:
+    """Tests for the logs CLI commands"""
+
+    def test_show_follow_reopens_cleared_log(self, tmp_path, monkeypatch):
+        """Test that following the log switches to the new file after 'logs clear' moves the old one away."""
+        log_file = tmp_path / "wallpy.log"
+        log_file.write_text("old line\n")
+        ctx = SimpleNamespace(obj={"logs_dir": tmp_path})
+
+        shown = []
+        monkeypatch.setattr(logs, "Text", lambda text: shown.append(text) or Text(text))
+
+        ticks = []
+        def fake_sleep(seconds):
+            ticks.append(seconds)
+            if len(ticks) == 1:
+                logs.clear(ctx)
+                with open(log_file, "a") as f:
+                    f.write("new line\n")
+            else:
+                raise RuntimeError("stop following")
+        monkeypatch.setattr(logs.time, "sleep", fake_sleep)
+
+        logs.show(ctx, lines=10, follow=True)
+
+        assert shown[0] == "old line"
+        assert shown[-1] == "new line"
+        assert len(list(tmp_path.glob("wallpy.log.*.bak"))) == 1
+
+    def test_export_uses_zip_suffix(self, tmp_path, monkeypatch):
+        """Test that exported logs always land in a .zip file, whatever suffix was given."""
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        (logs_dir / "wallpy.log").write_text("line\n")
+        ctx = SimpleNamespace(obj={"logs_dir": logs_dir})
+
+        logs.export(ctx, tmp_path / "exported.txt")
+
+        assert not (tmp_path / "exported.txt").exists()
+        with zipfile.ZipFile(tmp_path / "exported.zip") as zf:
+            assert zf.namelist() == ["wallpy.log"]
@@ -0,0 +1,65 @@
+import os
+import errno
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import tomli_w
+
+from wallpy.cli.pack import preview, _copy_file
+from wallpy.models import Pack
+from wallpy.schedule import ScheduleManager
+
+
+class TestPackCLI:
+    """Tests for the pack CLI commands"""
+
+    def test_preview_piped_schedule_is_tab_separated(self, tmp_path, capsys):
+        """Test that the schedule is printed as plain, uncropped tab-separated rows when not on a terminal."""
+        pack_dir = tmp_path / "pack"
+        (pack_dir / "images").mkdir(parents=True)
+        long_name = "a_very_long_wallpaper_file_name_that_would_not_fit_in_eighty_columns.jpg"
+        with open(pack_dir / "schedule.toml", "wb") as f:
+            tomli_w.dump({
+                "meta": {"type": "timeblocks", "name": "Piped"},
+                "timeblocks": {
+                    "day": {"start": "06:00", "end": "18:00", "images": [long_name]},
+                    "night": {"start": "sunset", "end": "06:00", "images": ["night.jpg"], "shuffle": True},
+                },
+            }, f)
+
+        config_manager = Mock()
+        config_manager.get_pack_by_uid.return_value = Pack(name="pack", path=pack_dir, uid="abc123")
+        config_manager.get_location.return_value = None
+        schedule_manager = ScheduleManager()
+        schedule_manager.cache_dir = tmp_path / "cache"
+        ctx = SimpleNamespace(obj={"config_manager": config_manager, "schedule_manager": schedule_manager})
+
+        preview(ctx, "active", "abc123")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "Timeblock\tTime Range\tImages\tSettings" in lines
+        day_row = next(line for line in lines if line.startswith("day\t"))
+        assert day_row == f"day\t06:00 - 18:00\t{long_name}\t-"
+        night_row = next(line for line in lines if line.startswith("night\t"))
+        assert night_row.split("\t")[1].endswith("(sunset → 06:00)")
+        assert night_row.split("\t")[3] == "🔄 shuffled"
+
+    def test_copy_file_falls_back_when_copy_file_range_stops_short(self, tmp_path, monkeypatch):
+        """Test that a copy_file_range that stops early or fails still produces a complete copy."""
+        src = tmp_path / "image.jpg"
+        src.write_bytes(b"x" * 100_000)
+
+        # Copies part of the file, then returns 0 as if nothing more could be copied
+        calls = []
+        def short_copy_file_range(src_fd, dst_fd, count):
+            calls.append(count)
+            return 0 if len(calls) > 1 else os.write(dst_fd, b"x" * 10)
+        monkeypatch.setattr(os, "copy_file_range", short_copy_file_range, raising=False)
+        _copy_file(str(src), str(tmp_path / "short.jpg"))
+        assert (tmp_path / "short.jpg").read_bytes() == src.read_bytes()
+
+        def failing_copy_file_range(src_fd, dst_fd, count):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        monkeypatch.setattr(os, "copy_file_range", failing_copy_file_range, raising=False)
+        _copy_file(str(src), str(tmp_path / "failed.jpg"))
+        assert (tmp_path / "failed.jpg").read_bytes() == src.read_bytes()
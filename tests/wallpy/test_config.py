@@ -1,7 +1,18 @@
+import sys
+import shutil
 import pytest
 from pathlib import Path
 from wallpy.config import ConfigManager, PackSearchPaths, generate_uid
 
+# --- Helper Functions ---
+def make_pack(root, name):
+    """Creates a minimal pack (schedule.toml and one image) under root"""
+    pack_dir = root / name
+    (pack_dir / "images").mkdir(parents=True)
+    (pack_dir / "schedule.toml").write_text("")
+    (pack_dir / "images" / "day.jpg").write_bytes(b"")
+    return pack_dir
+
 class TestConfigManager:
     def test_config_manager_initialization(self):
         """Test that ConfigManager initializes correctly."""
@@ -16,6 +27,55 @@ class TestConfigManager:
         config = config_manager.load_config()
         assert isinstance(config, dict)
     
+    def test_load_config_creates_missing_or_empty_config(self, tmp_path, monkeypatch):
+        """Test that a missing or empty config file is replaced by the default config."""
+        config_manager = ConfigManager()
+        monkeypatch.setattr(config_manager, "config_file_path", tmp_path / "config.toml")
+        monkeypatch.setattr(config_manager, "packs_dir", tmp_path / "packs")
+
+        config = config_manager.load_config()
+        assert config and config_manager.config_file_path.stat().st_size > 0
+
+        config_manager.config_file_path.write_bytes(b"")
+        assert config_manager.load_config() == config
+    
+    def test_load_config_returns_independent_copies(self):
+        """Test that cached config reads can't be mutated by callers."""
+        config_manager = ConfigManager()
+        config = config_manager.load_config()
+        config["__scratch__"] = True
+        assert "__scratch__" not in config_manager.load_config()
+    
+    def test_single_instance_guard(self, monkeypatch):
+        """Test that a second ConfigManager raises when the debug guard is enabled."""
+        monkeypatch.setenv("WALLPY_DEBUG_SINGLE_CM", "1")
+        monkeypatch.setattr(ConfigManager, "_instances", 1)
+        with pytest.raises(RuntimeError):
+            ConfigManager()
+    
+    def test_find_similar_pack(self):
+        """Test that misspelled pack names suggest the closest pack first."""
+        config_manager = ConfigManager()
+        matches = config_manager.find_similar_pack("Defualt", ["nature", "default", "space"])
+        assert matches
+        assert matches[0] == "default"
+    
+    def test_find_similar_pack_rapidfuzz(self):
+        """Test suggestions through rapidfuzz when the fuzzy extra is installed."""
+        pytest.importorskip("rapidfuzz")
+        config_manager = ConfigManager()
+        matches = config_manager.find_similar_pack("Defualt", ["nature", "Default", "space"])
+        assert matches[0] == "Default"
+        assert config_manager.find_similar_pack("zzzz", ["nature", "default", "space"]) == []
+    
+    def test_find_similar_pack_difflib_fallback(self, monkeypatch):
+        """Test that suggestions fall back to difflib when rapidfuzz is not installed."""
+        monkeypatch.setitem(sys.modules, "rapidfuzz", None)  # Makes the import raise ImportError
+        config_manager = ConfigManager()
+        matches = config_manager.find_similar_pack("Defualt", ["nature", "default", "space"])
+        assert matches
+        assert matches[0] == "default"
+    
     def test_get_active_pack(self):
         """Test getting the active pack."""
         config_manager = ConfigManager()
@@ -31,6 +91,113 @@ class TestConfigManager:
         config_manager = ConfigManager()
         packs = config_manager.load_packs()
         assert isinstance(packs, dict)
+    
+    def test_scan_directory_cache_invalidation(self, tmp_path):
+        """Test that cached directory scans pick up added and emptied packs."""
+        config_manager = ConfigManager()
+        config_manager._scan_cache = {}  # Keep the test away from the on-disk cache
+
+        make_pack(tmp_path, "first")
+        assert list(config_manager.scan_directory(tmp_path, use_cache=True)) == ["first"]
+        # Unchanged directory is served from the cache
+        assert list(config_manager.scan_directory(tmp_path, use_cache=True)) == ["first"]
+
+        second = make_pack(tmp_path, "second")
+        assert sorted(config_manager.scan_directory(tmp_path, use_cache=True)) == ["first", "second"]
+
+        (second / "images" / "day.jpg").unlink()
+        assert list(config_manager.scan_directory(tmp_path, use_cache=True)) == ["first"]
+
+    def test_load_packs_memoized(self, tmp_path, monkeypatch):
+        """Test that load_packs reuses its result until a root changes or it is invalidated."""
+        config_manager = ConfigManager()
+        monkeypatch.setattr(config_manager, "pack_search_paths", [tmp_path])
+        config_manager.invalidate()
+
+        packs = config_manager.load_packs(skip_custom=True)
+        assert config_manager.load_packs(skip_custom=True) is packs
+
+        make_pack(tmp_path, "added")
+        reloaded = config_manager.load_packs(skip_custom=True)
+        assert "added" in reloaded
+
+        config_manager.invalidate()
+        assert config_manager.load_packs(skip_custom=True) is not reloaded
+    
+    def test_invalidate_clears_pack_lookups(self, tmp_path, monkeypatch):
+        """Test that UID lookups and suggestion names don't outlive invalidate()."""
+        config_manager = ConfigManager()
+        roots = tmp_path / "roots"
+        roots.mkdir()
+        monkeypatch.setattr(config_manager, "_pack_roots", lambda skip_custom=False: [(roots, None)])
+        monkeypatch.setattr(config_manager, "scan_cache_path", tmp_path / "packs.json")
+        monkeypatch.setattr(config_manager, "uid_index_path", tmp_path / "uid_index.json")
+        config_manager._scan_cache = None
+        config_manager._saved_uid_index = None
+        config_manager.invalidate()
+
+        removed = make_pack(roots, "zz")
+        uid = config_manager.load_packs()["zz"][0].uid
+        assert config_manager.get_pack_by_uid(uid) is not None
+        assert "zz" in config_manager.get_nondefault_pack_names()
+
+        shutil.rmtree(removed)
+        config_manager.invalidate()
+        assert config_manager.get_pack_by_uid(uid) is None
+        assert "zz" not in config_manager.get_nondefault_pack_names()
+    
+    def test_wallpacks_loaded_lazily(self, monkeypatch):
+        """Test that packs are only scanned once wallpacks is first used."""
+        calls = []
+        original = ConfigManager.load_packs
+        monkeypatch.setattr(ConfigManager, "load_packs", lambda self, *args, **kwargs: calls.append(1) or original(self, *args, **kwargs))
+
+        config_manager = ConfigManager()
+        assert not calls
+        assert config_manager.wallpacks
+        assert config_manager.wallpacks is config_manager.wallpacks
+        assert len(calls) == 1
+
+    def test_get_pack_by_uid_from_index(self, tmp_path, monkeypatch):
+        """Test that UID lookups before any scan are answered from the on-disk index, read only once."""
+        config_manager = ConfigManager()
+        monkeypatch.setattr(config_manager, "pack_search_paths", [tmp_path / "roots"])
+        monkeypatch.setattr(config_manager, "scan_cache_path", tmp_path / "packs.json")
+        monkeypatch.setattr(config_manager, "uid_index_path", tmp_path / "uid_index.json")
+        config_manager._scan_cache = None
+        config_manager._saved_uid_index = None
+        config_manager.invalidate()
+        make_pack(tmp_path / "roots", "indexed")
+        pack = config_manager.load_packs()["indexed"][0]
+        assert (tmp_path / "uid_index.json").exists()
+
+        config_manager.invalidate()
+        reads = []
+        original = config_manager._load_uid_index
+        monkeypatch.setattr(config_manager, "_load_uid_index", lambda: reads.append(1) or original())
+        monkeypatch.setattr(config_manager, "load_packs", lambda *args, **kwargs: pytest.fail("packs were rescanned"))
+        assert config_manager.get_pack_by_uid(pack.uid) == pack
+        assert config_manager.get_pack_by_uid(pack.uid) == pack
+        assert len(reads) == 1
+    
+    def test_count_packs(self, tmp_path):
+        """Test that count_packs agrees with scan_directory."""
+        config_manager = ConfigManager()
+        for name in ("one", "two"):
+            make_pack(tmp_path, name)
+        (tmp_path / "not_a_pack").mkdir()
+
+        assert config_manager.count_packs(tmp_path) == 2
+        assert config_manager.count_packs(tmp_path / "one") == 1
+        assert config_manager.count_packs(tmp_path / "missing") == 0
+        assert config_manager.count_packs(tmp_path) == sum(len(packs) for packs in config_manager.scan_directory(tmp_path).values())
+    
+    def test_get_nondefault_pack_names(self):
+        """Test that suggestion names leave out the default pack."""
+        config_manager = ConfigManager()
+        names = config_manager.get_nondefault_pack_names()
+        assert "default" not in names
+        assert set(names) == {name for name in config_manager.load_packs() if name.lower() != "default"}
 
 class TestPackSearchPaths:
     def test_pack_search_paths(self):
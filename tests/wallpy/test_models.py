@@ -75,6 +75,8 @@ class TestModels:
         # Test with shuffle
         day = DaySchedule(images=images, shuffle=True)
         assert day.shuffle is True
+        assert Path("monday2.jpg") in day.image_set
+        assert Path("tuesday.jpg") not in day.image_set
     
     def test_location(self):
         """Test Location creation."""
@@ -139,7 +139,13 @@ class TestScheduleManager:
         block = schedule_manager.get_block(schedule)
         # We can't predict which block will be current, but it should return a block
         assert block is None or isinstance(block, TimeBlock)
-    
+
+        # Pinning the time makes the result predictable
+        when = datetime.combine(date.today(), time(13, 0))
+        assert schedule_manager.get_block(schedule, when=when) is afternoon_block
+        assert schedule_manager.get_block(schedule, get_next=True, when=when) is evening_block
+        assert schedule_manager.get_wallpaper(schedule, when=when) == Path("afternoon.jpg")
+
     def test_get_current_block_with_invalid_schedule(self, schedule_manager):
         """Test that get_block returns None for non-timeblock schedules"""
         # Test with day-based schedule.
@@ -163,3 +163,25 @@ class TestScheduleParser:
         assert isinstance(schedule, Schedule)
         assert schedule.meta.type == ScheduleType.DAYS
         assert "monday" in schedule.days
+    
+    def test_load_schedule_cache(self, parser, tmp_path):
+        """Test that parsed schedules are cached and re-parsed when the file changes."""
+        parser.cache_dir = tmp_path / "cache"
+        schedule_file = tmp_path / "schedule.toml"
+        with open(schedule_file, "wb") as f:
+            tomli_w.dump({"meta": {"type": "days", "name": "First"}, "days": {"monday": "monday.jpg"}}, f)
+        
+        assert parser.load_schedule(schedule_file).meta.name == "First"
+        assert len(list(parser.cache_dir.iterdir())) == 1
+        first = parser.load_schedule(schedule_file)
+        assert first.meta.name == "First"
+        assert parser.load_schedule(schedule_file) is first
+        
+        with open(schedule_file, "wb") as f:
+            tomli_w.dump({"meta": {"type": "days", "name": "Second one"}, "days": {"monday": "monday.jpg"}}, f)
+        assert parser.load_schedule(schedule_file).meta.name == "Second one"
+    
+    def test_load_schedule_missing_file(self, parser, tmp_path):
+        """Test that a missing schedule file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            parser.load_schedule(tmp_path / "schedule.toml")
@@ -82,6 +82,25 @@ class TestSolarTimeCalculator:
         # Check that the cache has two entries
         assert len(calculator._cache) == 2
     
+    def test_resolve_many(self):
+        """Test that batch resolution matches resolve_datetime and computes the sun once"""
+        calculator = SolarTimeCalculator()
+        test_date = date(2023, 6, 21)
+        location = Location(
+            latitude=28.6139,
+            longitude=77.2090,
+            timezone="Asia/Kolkata"
+        )
+        specs = [
+            TimeSpec(type=TimeSpecType.SOLAR, base="sunrise", offset=10),
+            TimeSpec(type=TimeSpecType.ABSOLUTE, base=time(12, 0)),
+            TimeSpec(type=TimeSpecType.SOLAR, base="sunset"),
+        ]
+        
+        results = calculator.resolve_many(specs, test_date, location)
+        assert results == [calculator.resolve_datetime(spec, test_date, location) for spec in specs]
+        assert len(calculator._sun_cache) == 1
+    
     def test_resolve_datetime(self):
         """Test resolving TimeSpec to datetime"""
         calculator = SolarTimeCalculator()